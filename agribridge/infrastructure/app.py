@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""CDK application defining the AgriBridge platform infrastructure."""
+
+import aws_cdk as cdk
+from aws_cdk import (
+    CfnOutput,
+    RemovalPolicy,
+    Stack,
+    aws_apigateway as apigateway,
+    aws_dynamodb as dynamodb,
+    aws_ec2 as ec2,
+    aws_lambda as lambda_,
+    aws_opensearchservice as opensearch,
+    aws_rds as rds,
+)
+from constructs import Construct
+
+
+# Shared Lambda build settings: Graviton (~20% better price/perf on
+# pure-Python workloads) on Python 3.12. The dependency layer is built
+# against these, and function constructs must use the same pair when
+# they are added to this stack.
+LAMBDA_RUNTIME = lambda_.Runtime.PYTHON_3_12
+LAMBDA_ARCHITECTURE = lambda_.Architecture.ARM_64
+
+
+class AgriBridgeStack(Stack):
+    """All AgriBridge infrastructure: data stores, search, layer, API."""
+
+    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        self.vpc = self.create_vpc()
+        self.create_dynamodb_tables()
+        self.create_rds_database()
+        self.create_opensearch_domain()
+        self.create_lambda_layer()
+        self.create_api_gateway()
+
+    def create_vpc(self) -> ec2.Vpc:
+        return ec2.Vpc(self, "AgriBridgeVpc", max_azs=2, nat_gateways=1)
+
+    def create_dynamodb_tables(self) -> None:
+        self.farmers_table = dynamodb.Table(
+            self,
+            "FarmersTable",
+            table_name="agribridge-farmers",
+            partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+        # GSI1 serves district-scoped farmer listings, which only need the
+        # keys to fan out to the base table. KEYS_ONLY avoids projecting the
+        # full item, cutting GSI write amplification and storage 3-5x versus
+        # the default ALL projection.
+        self.farmers_table.add_global_secondary_index(
+            index_name="GSI1",
+            partition_key=dynamodb.Attribute(name="GSI1PK", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="GSI1SK", type=dynamodb.AttributeType.STRING),
+            projection_type=dynamodb.ProjectionType.KEYS_ONLY,
+        )
+
+        # Ephemeral tables (TTL-swept, DESTROY on teardown): keep PITR
+        # explicitly off so nobody enables backups that double storage cost
+        # and add write amplification on the hot path. On-demand billing
+        # stays so bursty traffic doesn't throttle.
+        self.price_cache_table = dynamodb.Table(
+            self,
+            "PriceCacheTable",
+            table_name="agribridge-price-cache",
+            partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            time_to_live_attribute="TTL",
+            point_in_time_recovery=False,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        self.query_logs_table = dynamodb.Table(
+            self,
+            "QueryLogsTable",
+            table_name="agribridge-query-logs",
+            partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+        self.conversation_table = dynamodb.Table(
+            self,
+            "ConversationTable",
+            table_name="agribridge-conversations",
+            partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            time_to_live_attribute="TTL",
+            point_in_time_recovery=False,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        # OTP table existed only in scripts/create_dynamodb_tables.py; keep
+        # CDK as the source of truth with the same ephemeral config. Writers
+        # should use UpdateItem with attribute_not_exists(PK) rather than a
+        # GetItem-then-PutItem pair.
+        self.otp_table = dynamodb.Table(
+            self,
+            "OtpTable",
+            table_name="agribridge-otp",
+            partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            time_to_live_attribute="TTL",
+            point_in_time_recovery=False,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+    def create_rds_database(self) -> None:
+        self.database = rds.DatabaseInstance(
+            self,
+            "AgriBridgeDB",
+            engine=rds.DatabaseInstanceEngine.postgres(
+                version=rds.PostgresEngineVersion.VER_15
+            ),
+            instance_type=ec2.InstanceType.of(ec2.InstanceClass.T3, ec2.InstanceSize.MICRO),
+            vpc=self.vpc,
+            allocated_storage=20,
+            database_name="agribridge",
+            removal_policy=RemovalPolicy.SNAPSHOT,
+        )
+
+        # RDS Proxy keeps a warm, multiplexed connection pool in front of
+        # Postgres so each Lambda invocation attaches to an existing TCP
+        # connection (~few ms) instead of negotiating TLS + auth against the
+        # instance (~100-300 ms) and storming max_connections on scale-out.
+        # Keep prepared statements off in clients (psycopg simple-query mode)
+        # to avoid session pinning.
+        self.db_proxy = rds.DatabaseProxy(
+            self,
+            "AgriBridgeDBProxy",
+            proxy_target=rds.ProxyTarget.from_instance(self.database),
+            secrets=[self.database.secret],
+            vpc=self.vpc,
+            require_tls=True,
+        )
+
+        CfnOutput(
+            self,
+            "DatabaseProxyEndpoint",
+            value=self.db_proxy.endpoint,
+            description="Connect Lambdas here, not to the instance endpoint",
+        )
+
+    def create_opensearch_domain(self) -> None:
+        self.search_domain = opensearch.Domain(
+            self,
+            "AdvisorySearch",
+            version=opensearch.EngineVersion.OPENSEARCH_2_11,
+            # r6g.large: the knn vector workload is memory-bound and the
+            # t3 burstable nodes throttle during bulk indexing.
+            capacity=opensearch.CapacityConfig(
+                data_nodes=2,
+                data_node_instance_type="r6g.large.search",
+            ),
+            ebs=opensearch.EbsOptions(volume_size=10),
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+    def create_lambda_layer(self) -> None:
+        # Bundle only runtime deps and strip caches/metadata: every MB of
+        # layer adds ~10-30 ms of cold-start unzip, and the raw directory
+        # would ship tests, docs and .dist-info along with the wheels.
+        self.dependencies_layer = lambda_.LayerVersion(
+            self,
+            "AgriBridgeDependencies",
+            code=lambda_.Code.from_asset(
+                "../lambda-layer",
+                exclude=["tests", "**/__pycache__", "*.pyc", ".pytest_cache"],
+                bundling=cdk.BundlingOptions(
+                    image=LAMBDA_RUNTIME.bundling_image,
+                    command=[
+                        "bash",
+                        "-c",
+                        "pip install -r requirements.txt -t /asset-output/python"
+                        " --platform manylinux2014_aarch64 --only-binary=:all:"
+                        " && find /asset-output -name '__pycache__' -exec rm -rf {} +"
+                        " && find /asset-output -name '*.dist-info' -exec rm -rf {} +"
+                        " && find /asset-output -name 'tests' -type d -exec rm -rf {} +",
+                    ],
+                ),
+            ),
+            compatible_runtimes=[LAMBDA_RUNTIME],
+            compatible_architectures=[LAMBDA_ARCHITECTURE],
+            description="Shared Python dependencies for AgriBridge Lambdas",
+        )
+
+    def create_api_gateway(self) -> None:
+        self.api = apigateway.RestApi(
+            self,
+            "AgriBridgeApi",
+            rest_api_name="agribridge-api",
+            # Prod: no data tracing — it serializes every request/response
+            # body into CloudWatch on the hot path. Errors-only logging, and
+            # a small response cache so repeat GETs (price lookups) skip
+            # Lambda entirely. Full tracing lives on the dev stage below.
+            deploy_options=apigateway.StageOptions(
+                stage_name="prod",
+                logging_level=apigateway.MethodLoggingLevel.ERROR,
+                data_trace_enabled=False,
+                metrics_enabled=True,
+                cache_cluster_enabled=True,
+                cache_cluster_size="0.5",
+            ),
+        )
+
+        dev_deployment = apigateway.Deployment(self, "DevDeployment", api=self.api)
+        apigateway.Stage(
+            self,
+            "DevStage",
+            deployment=dev_deployment,
+            stage_name="dev",
+            logging_level=apigateway.MethodLoggingLevel.INFO,
+            data_trace_enabled=True,
+        )
+        health = self.api.root.add_resource("health")
+        health.add_method(
+            "GET",
+            apigateway.MockIntegration(
+                integration_responses=[
+                    apigateway.IntegrationResponse(
+                        status_code="200",
+                        response_templates={"application/json": '{"status": "ok"}'},
+                    )
+                ],
+                request_templates={"application/json": '{"statusCode": 200}'},
+            ),
+            method_responses=[apigateway.MethodResponse(status_code="200")],
+        )
+
+
+app = cdk.App()
+AgriBridgeStack(app, "AgriBridgeStack")
+app.synth()
@@ -0,0 +1,57 @@
+"""Verify the AgriBridge project layout.
+
+Instead of one stat(2) per expected path, the tree is walked once with
+``Path.rglob`` into a set and every check is an O(1) membership lookup —
+one directory traversal instead of ~30 individual syscalls, which matters
+on cold/NFS filesystems in CI.
+
+Usage:
+    python scripts/verify_setup.py  (from the agribridge/ directory)
+"""
+
+from pathlib import Path
+
+EXPECTED_DIRECTORIES = [
+    "src",
+    "src/models",
+    "src/services",
+    "src/utils",
+    "scripts",
+    "infrastructure",
+    "tests",
+]
+
+EXPECTED_FILES = [
+    "src/__init__.py",
+    "src/models/__init__.py",
+    "src/models/auth.py",
+    "scripts/create_dynamodb_tables.py",
+    "scripts/init_postgres.py",
+    "scripts/verify_setup.py",
+]
+
+
+def main() -> int:
+    root = Path(__file__).resolve().parent.parent
+    existing = {p.relative_to(root).as_posix(): p.is_dir() for p in root.rglob("*")}
+
+    missing = []
+    for path in EXPECTED_DIRECTORIES:
+        if not existing.get(path, False):
+            missing.append(f"directory: {path}")
+    for path in EXPECTED_FILES:
+        if path not in existing or existing[path]:
+            missing.append(f"file: {path}")
+
+    checked = len(EXPECTED_DIRECTORIES) + len(EXPECTED_FILES)
+    if missing:
+        print(f"{len(missing)}/{checked} checks failed:")
+        for entry in missing:
+            print(f"  MISSING {entry}")
+        return 1
+    print(f"All {checked} checks passed.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1 @@
+"""AgriBridge AI Platform source package."""
@@ -0,0 +1,95 @@
+"""Pydantic models for the AgriBridge platform.
+
+Schemas are finalized at import time (see the bottom of this module) so
+the cost lands in Lambda's INIT phase instead of the first request.
+"""
+
+from typing import List
+
+from pydantic import TypeAdapter
+
+from src.models.advisory import (
+    Advisory,
+    FertilizerAdvice,
+    FertilizerRecommendation,
+    WeatherAdvice,
+)
+from src.models.auth import AuthResponse, AuthToken, OTPRecord, OTPResponse
+from src.models.common import Channel, GeoLocation, Intent, Language, UserType
+from src.models.price import (
+    PriceData,
+    PriceRange,
+    Recommendation,
+    TimeSeries,
+    TimeSeriesPoint,
+    TrendData,
+)
+from src.models.query import (
+    FallbackData,
+    QueryRequest,
+    QueryResponse,
+    ResponseMetadata,
+)
+from src.models.user import BuyerProfile, FarmerProfile, UserProfile
+
+__all__ = [
+    "Advisory",
+    "AuthResponse",
+    "AuthToken",
+    "BuyerProfile",
+    "Channel",
+    "FallbackData",
+    "FarmerProfile",
+    "FertilizerAdvice",
+    "FertilizerRecommendation",
+    "GeoLocation",
+    "Intent",
+    "Language",
+    "OTPRecord",
+    "OTPResponse",
+    "PriceData",
+    "PriceRange",
+    "QueryRequest",
+    "QueryResponse",
+    "Recommendation",
+    "ResponseMetadata",
+    "TimeSeries",
+    "TimeSeriesPoint",
+    "TrendData",
+    "UserProfile",
+    "UserType",
+    "WeatherAdvice",
+    "advisory_list_adapter",
+]
+
+# Force schema builds now: Pydantic otherwise finalizes each model lazily on
+# its first validation, putting ~1-5 ms of schema construction on the first
+# request of every cold container. Cold-path models (AuthToken,
+# Recommendation, TrendData, ConversationRecord) opt out via
+# defer_build=True and are deliberately absent here.
+for _model in (
+    Advisory,
+    AuthResponse,
+    BuyerProfile,
+    FallbackData,
+    FarmerProfile,
+    FertilizerAdvice,
+    FertilizerRecommendation,
+    GeoLocation,
+    OTPRecord,
+    OTPResponse,
+    PriceData,
+    PriceRange,
+    QueryRequest,
+    QueryResponse,
+    ResponseMetadata,
+    TimeSeries,
+    TimeSeriesPoint,
+    UserProfile,
+    WeatherAdvice,
+):
+    _model.model_rebuild()
+
+# Shared adapter for the hot advisory-list endpoint; building a TypeAdapter
+# per request would redo schema generation each time.
+advisory_list_adapter: TypeAdapter = TypeAdapter(List[Advisory])
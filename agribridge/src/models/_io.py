@@ -0,0 +1,30 @@
+"""Fast record (de)serialization for the write and cache-hydration paths.
+
+``model_dump_json`` walks the schema through pydantic-core; for the bulk
+ingest loop and cache reads, orjson serializes the plain-dict dump in C
+(datetimes included) at roughly 5x the stdlib speed, and hydration from
+our own serialized records can skip validation entirely.
+"""
+
+from typing import Type, TypeVar
+
+import orjson
+
+from pydantic import BaseModel
+
+TRecord = TypeVar("TRecord", bound=BaseModel)
+
+# Z-suffixed UTC timestamps, matching the DateTimeZ serialization used by
+# the pydantic JSON path.
+_DUMP_OPTS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+
+def dumps(record: BaseModel) -> bytes:
+    """Serialize a record to JSON bytes via orjson."""
+    return orjson.dumps(record.model_dump(), option=_DUMP_OPTS)
+
+
+def loads(data: bytes, cls: Type[TRecord]) -> TRecord:
+    """Hydrate a record from bytes we serialized ourselves, skipping
+    validation (trusted round-trip; see ``from_dynamo_item``)."""
+    return cls.model_construct(**orjson.loads(data))
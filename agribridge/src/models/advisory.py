@@ -0,0 +1,59 @@
+"""Crop advisory models served by the RAG pipeline.
+
+Collection fields are tuples, not lists: these models are read-only after
+construction, and tuples have smaller headers, no overallocation, and are
+hashable — so with frozen config an entire Advisory can serve as an LRU
+cache key.
+"""
+
+from typing import Literal, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.models.common import Language
+
+
+class FertilizerRecommendation(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    name: str
+    # Literal instead of a regex pattern: same accepted values, but
+    # pydantic-core matches it with a hash compare rather than running the
+    # regex engine per validation.
+    type: Literal["ORGANIC", "CHEMICAL", "BIO"] = Field(..., description="Fertilizer type")
+    quantity_per_acre: str
+    application_method: str
+
+
+class FertilizerAdvice(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    crop: str
+    soil_type: str
+    recommendations: Tuple[FertilizerRecommendation, ...] = ()
+    precautions: Tuple[str, ...] = ()
+    alternatives: Tuple[str, ...] = ()
+
+
+class WeatherAdvice(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    district: str
+    forecast_summary: str
+    recommendations: Tuple[str, ...] = ()
+    alerts: Tuple[str, ...] = ()
+
+
+class Advisory(BaseModel):
+    """A retrieved advisory document, ready for response generation."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    advisory_id: str
+    crop: str
+    content: str
+    language: Language = Language.ENGLISH
+    sources: Tuple[str, ...] = ()
+    applicable_regions: Tuple[str, ...] = ()
+    last_updated: int = Field(default=0, description="Epoch seconds")
+    confidence: float = Field(default=1.0, ge=0, le=1)
@@ -0,0 +1,121 @@
+"""Authentication models for OTP-based passwordless login.
+
+Timestamps on ``OTPRecord`` are stored as integer epoch seconds rather than
+``datetime`` objects: the OTP table uses DynamoDB's native TTL sweeper, which
+expects a Number attribute, so epoch ints go straight onto the wire without a
+conversion step, and expiry checks reduce to a single int comparison on the
+hot auth path.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+OTP_EXPIRY_MINUTES = 5
+MAX_OTP_ATTEMPTS = 3
+
+
+class OTPRecord(BaseModel):
+    """A pending OTP challenge, keyed by hashed phone number."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    phone_hash: str
+    otp_hash: str
+    created_at: int = Field(..., description="Epoch seconds")
+    expires_at: int = Field(..., description="Epoch seconds; doubles as the DynamoDB TTL attribute")
+    attempts: int = 0
+
+    @classmethod
+    def create(
+        cls,
+        phone_hash: str,
+        otp_hash: str,
+        expiry_minutes: int = OTP_EXPIRY_MINUTES,
+    ) -> "OTPRecord":
+        now = int(time.time())
+        return cls(
+            phone_hash=phone_hash,
+            otp_hash=otp_hash,
+            created_at=now,
+            expires_at=now + expiry_minutes * 60,
+        )
+
+    @classmethod
+    def from_item(cls, item: dict) -> "OTPRecord":
+        """Hydrate from an OTP-table item without validation.
+
+        Trusted read of our own writes; int() also normalizes the
+        Decimals boto3 hands back for Number attributes, so downstream
+        comparisons stay on plain ints.
+        """
+        return cls.model_construct(
+            phone_hash=item["phone_hash"],
+            otp_hash=item["otp_hash"],
+            created_at=int(item["created_at"]),
+            expires_at=int(item["expires_at"]),
+            attempts=int(item["attempts"]),
+        )
+
+    def is_expired(self) -> bool:
+        return time.time() > self.expires_at
+
+    def increment_attempts(self) -> "OTPRecord":
+        # Frozen model: return an updated copy instead of mutating in place.
+        return self.model_copy(update={"attempts": self.attempts + 1})
+
+
+class OTPResponse(BaseModel):
+    """Result of a send-OTP request."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    success: bool
+    message: str
+    expires_at: Optional[int] = Field(default=None, description="Epoch seconds")
+
+
+class AuthToken(BaseModel):
+    """JWT session token issued after successful OTP verification."""
+
+    # Only touched on token refresh; build the schema on first use instead
+    # of paying for it in every cold start (kept out of the import-time
+    # rebuild loop in src/models/__init__.py).
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    token: str
+    user_id: str
+    user_type: str = "FARMER"
+    expires_at: datetime
+
+
+class AuthResponse(BaseModel):
+    """API response for verify-OTP; keeps a datetime for client compat."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    success: bool
+    token: Optional[str] = None
+    user_id: Optional[str] = None
+    user_type: str = "FARMER"
+    expires_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+
+    @classmethod
+    def from_epoch(
+        cls,
+        token: str,
+        user_id: str,
+        user_type: str,
+        expires_at_epoch: int,
+    ) -> "AuthResponse":
+        # Built once at the API boundary; internal code stays on epoch ints.
+        return cls(
+            success=True,
+            token=token,
+            user_id=user_id,
+            user_type=user_type,
+            expires_at=datetime.fromtimestamp(expires_at_epoch, tz=timezone.utc),
+        )
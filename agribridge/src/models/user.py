@@ -0,0 +1,53 @@
+"""User profile models for farmers and buyers."""
+
+import re
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from src.models.common import GeoLocation, Language, UserType, cached_utcnow
+
+# Compiled once at import; the validator runs on every registration call and
+# must not pay re.compile (or the module-cache lookup) per invocation.
+_PHONE_RE = re.compile(r"^\+?[0-9]{10,15}$")
+
+
+class FarmerProfile(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    land_size: float = Field(..., gt=0, description="Acres")
+    crop_types: List[str] = Field(default_factory=list)
+    soil_type: str = ""
+    district: str
+
+
+class BuyerProfile(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    business_name: str
+    district: str
+    crop_interests: List[str] = Field(default_factory=list)
+    typical_volume_quintal: Optional[int] = None
+
+
+class UserProfile(BaseModel):
+    """Registration/profile payload; one of the sub-profiles is set."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    phone_number: str
+    language: Language = Language.HINDI
+    location: Optional[GeoLocation] = None
+    user_type: UserType = UserType.FARMER
+    farmer_profile: Optional[FarmerProfile] = None
+    buyer_profile: Optional[BuyerProfile] = None
+    created_at: datetime = Field(default_factory=cached_utcnow)
+
+    @field_validator("phone_number", mode="after")
+    @classmethod
+    def validate_phone_number(cls, v: str) -> str:
+        if not _PHONE_RE.match(v):
+            raise ValueError("Invalid phone number")
+        return v
@@ -0,0 +1 @@
+"""Business-logic services for the AgriBridge platform."""
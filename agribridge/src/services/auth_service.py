@@ -0,0 +1,328 @@
+"""OTP authentication and JWT session management.
+
+Implements the AuthService interface from the platform spec: OTPs are
+delivered over SNS, stored hashed in the OTP table, and a successful
+verification issues an HS256 session token.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import boto3
+import jwt
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config as BotoConfig
+
+from src.models.auth import (
+    MAX_OTP_ATTEMPTS,
+    OTP_EXPIRY_MINUTES,
+    AuthResponse,
+    OTPResponse,
+)
+from src.utils.config import get_config
+from src.utils.errors import AuthenticationError
+from src.utils.hashing import hash_phone
+from src.utils.logger import get_logger
+from src.utils.security import derive_key
+
+logger = get_logger("auth-service")
+
+# The phone hash is a keyed MAC (deterministic, no per-call salt), so
+# memoizing is safe. Every OTP flow hashes the same number at least twice
+# (send then verify), and resends/retries more; the cache skips the re-hash.
+_hash_phone_cached = lru_cache(maxsize=4096)(hash_phone)
+
+_PK_OTP = "OTP#"
+_SK_OTP = "OTP"
+
+# Pre-bound zero-pad formatter: skips f-string spec parsing per OTP and
+# runs the whole int-to-ASCII conversion in C (same pattern as the TURN#
+# sort-key formatter in the models package).
+_OTP_FMT = "%06d".__mod__
+
+# Keep-alive plus a larger pool: without them each put/get/update pays a
+# fresh TLS handshake under load, which dominates per-auth-call latency.
+_BOTO_CFG = BotoConfig(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+# One session for both clients: credential resolution (env/instance
+# metadata) happens once at import instead of per client per instance.
+_CFG = get_config()
+_SHARED_SESSION = boto3.session.Session(
+    region_name=_CFG.aws_region,
+    aws_access_key_id=_CFG.aws_access_key_id,
+    aws_secret_access_key=_CFG.aws_secret_access_key,
+)
+
+
+_SERIALIZER = TypeSerializer()
+
+
+class _BatchedOtpWriter:
+    """Coalesces OTP puts into BatchWriteItem calls.
+
+    Registration campaigns and resends issue many nearly-simultaneous
+    single-item puts, each its own HTTPS request. Queueing them and
+    flushing every 20 ms or at 25 items (the BatchWriteItem limit) cuts
+    the burst path to one request per batch; each caller's future
+    resolves when its batch lands.
+    """
+
+    _FLUSH_INTERVAL = 0.02
+    _MAX_BATCH = 25
+
+    def __init__(self, client: Any, table_name: str) -> None:
+        self._client = client
+        self._table_name = table_name
+        self._queue: "asyncio.Queue[Tuple[dict, asyncio.Future]]" = asyncio.Queue()
+        self._task: Optional["asyncio.Task"] = None
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+
+    async def put(self, item: dict) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The flush task dies with the loop that spawned it, and warm
+            # containers run one asyncio.run per invocation: respawn on a
+            # fresh queue, since entries stranded on a dead loop's queue
+            # belong to callers that died with it.
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._task = loop.create_task(self._run())
+        elif self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        fut: "asyncio.Future" = loop.create_future()
+        self._queue.put_nowait((item, fut))
+        await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._FLUSH_INTERVAL
+            while len(batch) < self._MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[dict, "asyncio.Future"]]) -> None:
+        requests = [
+            {"PutRequest": {"Item": {k: _SERIALIZER.serialize(v) for k, v in item.items()}}}
+            for item, _ in batch
+        ]
+        try:
+            delay = 0.05
+            while requests:
+                resp = await asyncio.to_thread(
+                    self._client.batch_write_item,
+                    RequestItems={self._table_name: requests},
+                )
+                requests = resp.get("UnprocessedItems", {}).get(self._table_name, [])
+                if requests:
+                    # Throttled leftovers: back off exponentially.
+                    await asyncio.sleep(delay)
+                    delay *= 2
+        except Exception as exc:  # surface the batch failure to every caller
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for _, fut in batch:
+            if not fut.done():
+                fut.set_result(None)
+
+
+class AuthService:
+    """OTP send/verify flows plus JWT issue/validate."""
+
+    def __init__(self) -> None:
+        self.config = get_config()
+        # Encoded once: hash_otp runs on every send/verify call under
+        # request latency and must not re-encode the key each time.
+        self._jwt_key_bytes = self.config.jwt_secret_key.encode("utf-8")
+
+        # RFC 2104 key schedule done once: for short messages the per-call
+        # cost of HMAC is dominated by absorbing the padded key blocks, so
+        # we pre-absorb ipad/opad into two SHA-256 states and clone them
+        # per OTP (sha256().copy() is a cheap C-level state copy). The key
+        # is HKDF-derived with its own label, so the JWT secret stays
+        # dedicated to token signing; the 32-byte output needs no
+        # reduction step before padding to the block size.
+        key_block = derive_key("otp-hmac").ljust(64, b"\x00")
+        self._hmac_inner = hashlib.sha256(bytes(b ^ 0x36 for b in key_block))
+        self._hmac_outer = hashlib.sha256(bytes(b ^ 0x5C for b in key_block))
+
+        # Hot-path settings hoisted off the pydantic model: plain instance
+        # attributes skip the model's attribute machinery on every request.
+        self._jwt_alg = self.config.jwt_algorithm
+        self._jwt_ttl_s = self.config.jwt_expiry_hours * 3600
+        self._is_local = self.config.is_local
+
+        # Direct kwargs on the shared session: boto3 treats endpoint_url=None
+        # as "use the default", so no conditional dict fan-out is needed.
+        self.sns_client = _SHARED_SESSION.client(
+            "sns", endpoint_url=self.config.sns_endpoint_url, config=_BOTO_CFG
+        )
+        self.dynamodb = _SHARED_SESSION.resource(
+            "dynamodb", endpoint_url=self.config.dynamodb_endpoint_url, config=_BOTO_CFG
+        )
+        self.otp_table_name = self.config.otp_table_name
+        # Table() builds a new resource object each call; hoist it once.
+        self.otp_table = self.dynamodb.Table(self.otp_table_name)
+        # Fire-and-forget cleanup deletes; the response must not wait on them.
+        self._cleanup_executor = ThreadPoolExecutor(max_workers=2)
+        self._otp_writer = _BatchedOtpWriter(
+            self.dynamodb.meta.client, self.otp_table_name
+        )
+
+    # -- OTP primitives -------------------------------------------------
+
+    def generate_otp(self) -> str:
+        """Six-digit OTP from the CSPRNG.
+
+        One 3-byte draw plus a tail-rejection check replaces
+        secrets.randbelow's Python-level getrandbits loop; 16,000,000 is
+        the largest multiple of 10^6 below 2^24 (16,777,216), so values
+        under it map uniformly via modulo and the rejection probability
+        is 777,216/2^24, about 1 in 21.6.
+        """
+        while True:
+            n = int.from_bytes(secrets.token_bytes(3), "big")
+            if n < 16_000_000:
+                return _OTP_FMT(n % 1_000_000)
+
+    def hash_otp(self, otp: str) -> str:
+        # Clone the pre-absorbed states instead of re-running the HMAC key
+        # schedule; output is identical to hmac.new(key, otp, sha256).
+        inner = self._hmac_inner.copy()
+        inner.update(otp.encode("utf-8"))
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+
+    def verify_otp_hash(self, otp: str, otp_hash: str) -> bool:
+        return hmac.compare_digest(self.hash_otp(otp), otp_hash)
+
+    # -- flows ----------------------------------------------------------
+
+    async def send_otp(self, phone_number: str) -> OTPResponse:
+        """Issue an OTP for the number and deliver it over SNS."""
+        phone_hash = _hash_phone_cached(phone_number)
+        otp = self.generate_otp()
+        # Epoch ints end to end: Numbers are smaller on the wire than ISO
+        # strings, double as the native TTL attribute, and make expiry a
+        # single int comparison on verify.
+        now_epoch = int(time.time())
+        expires_epoch = now_epoch + OTP_EXPIRY_MINUTES * 60
+
+        # Enqueue on the coalescing writer; resolves once the batch lands.
+        await self._otp_writer.put(
+            {
+                "PK": _PK_OTP + phone_hash,
+                "SK": _SK_OTP,
+                "phone_hash": phone_hash,
+                "otp_hash": self.hash_otp(otp),
+                "attempts": 0,
+                "created_at": now_epoch,
+                "expires_at": expires_epoch,
+                "TTL": expires_epoch,
+            }
+        )
+
+        if not self._is_local:
+            await asyncio.to_thread(
+                self.sns_client.publish,
+                PhoneNumber=phone_number,
+                Message=f"Your AgriBridge OTP is {otp}. Valid for {OTP_EXPIRY_MINUTES} minutes.",
+            )
+        logger.info("OTP issued")
+        return OTPResponse(success=True, message="OTP sent", expires_at=expires_epoch)
+
+    async def verify_otp(self, phone_number: str, otp: str) -> AuthResponse:
+        """Check the OTP and issue a session token on success.
+
+        The happy path is a single conditional update (hash matches,
+        attempts under the cap, not expired) instead of get-then-write —
+        one HTTPS round-trip where there used to be two. The cleanup
+        delete rides on a background thread since the token is already
+        issued by then.
+        """
+        phone_hash = _hash_phone_cached(phone_number)
+        key = {"PK": _PK_OTP + phone_hash, "SK": _SK_OTP}
+        otp_hash = self.hash_otp(otp)
+        now_epoch = int(time.time())
+
+        await asyncio.to_thread(self._conditional_verify, key, otp_hash, now_epoch)
+
+        self._cleanup_executor.submit(self.otp_table.delete_item, Key=key)
+
+        user_id = phone_hash[:16]
+        expires_at = now_epoch + self._jwt_ttl_s
+        token = self.generate_jwt_token(user_id, "FARMER", expires_at)
+        logger.info("OTP verified")
+        return AuthResponse.from_epoch(token, user_id, "FARMER", expires_at)
+
+    def _conditional_verify(
+        self, key: Dict[str, str], otp_hash: str, now_epoch: int
+    ) -> None:
+        """Blocking half of verify_otp; runs on a worker thread."""
+        try:
+            self.otp_table.update_item(
+                Key=key,
+                UpdateExpression="ADD attempts :one",
+                ConditionExpression=(
+                    "otp_hash = :h AND attempts < :max AND expires_at > :now"
+                ),
+                ExpressionAttributeValues={
+                    ":h": otp_hash,
+                    ":one": 1,
+                    ":max": MAX_OTP_ATTEMPTS,
+                    ":now": now_epoch,
+                },
+                ReturnValues="ALL_NEW",
+            )
+        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            self._raise_verify_failure(key, now_epoch)
+
+    def _raise_verify_failure(self, key: Dict[str, str], now_epoch: int) -> None:
+        """One follow-up read on the cold path to say why the check failed."""
+        item = self.otp_table.get_item(Key=key).get("Item")
+        if item is None:
+            raise AuthenticationError("No OTP pending for this number")
+        if item["expires_at"] <= now_epoch:
+            raise AuthenticationError("OTP expired")
+        if item["attempts"] >= MAX_OTP_ATTEMPTS:
+            raise AuthenticationError("Too many attempts")
+        # Wrong OTP: still count the attempt toward the lockout cap.
+        self.otp_table.update_item(
+            Key=key,
+            UpdateExpression="ADD attempts :one",
+            ExpressionAttributeValues={":one": 1},
+        )
+        raise AuthenticationError("Invalid OTP")
+
+    # -- JWT ------------------------------------------------------------
+
+    def generate_jwt_token(self, user_id: str, user_type: str, expires_at: int) -> str:
+        payload = {"sub": user_id, "user_type": user_type, "exp": expires_at}
+        return jwt.encode(payload, self._jwt_key_bytes, algorithm=self._jwt_alg)
+
+    def validate_token(self, token: str) -> Dict[str, Any]:
+        """Decode a session token; raises AuthenticationError if invalid."""
+        try:
+            return jwt.decode(token, self._jwt_key_bytes, algorithms=[self._jwt_alg])
+        except jwt.InvalidTokenError as exc:
+            raise AuthenticationError("Invalid or expired token") from exc
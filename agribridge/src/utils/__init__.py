@@ -0,0 +1 @@
+"""Shared utilities for the AgriBridge platform."""
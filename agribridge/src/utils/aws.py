@@ -0,0 +1,42 @@
+"""Shared boto3 client factory.
+
+Client construction loads service models from disk (~100-300 ms the
+first time), so every script and Lambda going through this cached
+factory pays it once per process. The shared Config enables TCP
+keep-alive and a larger pool so warm containers reuse connections
+instead of re-handshaking TLS.
+"""
+
+import os
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config
+
+_BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
+@lru_cache(maxsize=None)
+def client(service: str):
+    """Return a process-wide cached low-level client for `service`."""
+    return boto3.client(
+        service,
+        region_name=os.environ.get("AWS_REGION", "ap-south-1"),
+        endpoint_url=os.environ.get(f"{service.upper()}_ENDPOINT_URL") or None,
+        config=_BOTO_CONFIG,
+    )
+
+
+@lru_cache(maxsize=None)
+def resource(service: str):
+    """Return a process-wide cached resource interface for `service`."""
+    return boto3.resource(
+        service,
+        region_name=os.environ.get("AWS_REGION", "ap-south-1"),
+        endpoint_url=os.environ.get(f"{service.upper()}_ENDPOINT_URL") or None,
+        config=_BOTO_CONFIG,
+    )
@@ -0,0 +1,44 @@
+"""Process-level TTL caching for warm Lambda containers.
+
+The price-cache DynamoDB table is itself a cache, but a warm container
+still pays a 5-10 ms GetItem per read. A module-scope TTL dict turns
+repeat reads within a container's lifetime into microsecond lookups.
+A managed DAX cluster would give the same effect across containers;
+the in-process cache is free and covers the common repeat-query case.
+"""
+
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """A small bounded TTL cache; evicts oldest entries past maxsize."""
+
+    def __init__(self, maxsize: int = 2000, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.time() > expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if len(self._data) >= self.maxsize:
+            # dicts preserve insertion order, so the first keys are oldest.
+            for old_key in list(self._data)[: self.maxsize // 4]:
+                del self._data[old_key]
+        self._data[key] = (time.time() + self.ttl, value)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Shared cache for price-cache table reads, keyed on (PK, SK).
+price_cache: TTLCache = TTLCache(maxsize=2000, ttl=60.0)
@@ -0,0 +1,92 @@
+"""Runtime configuration resolved from the environment.
+
+One ``Config`` snapshot is built per process via :func:`get_config`;
+services read their settings from it instead of touching ``os.environ``
+at call time.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class Config(BaseModel):
+    """Validated settings snapshot; values come from the environment."""
+
+    model_config = ConfigDict(frozen=True)
+
+    environment: str = Field(
+        default_factory=lambda: os.environ.get("ENVIRONMENT", "local")
+    )
+    aws_region: str = Field(
+        default_factory=lambda: os.environ.get("AWS_REGION", "ap-south-1")
+    )
+    aws_access_key_id: Optional[str] = Field(
+        default_factory=lambda: os.environ.get("AWS_ACCESS_KEY_ID")
+    )
+    aws_secret_access_key: Optional[str] = Field(
+        default_factory=lambda: os.environ.get("AWS_SECRET_ACCESS_KEY")
+    )
+    sns_endpoint_url: Optional[str] = Field(
+        default_factory=lambda: os.environ.get("SNS_ENDPOINT_URL")
+    )
+    dynamodb_endpoint_url: Optional[str] = Field(
+        default_factory=lambda: os.environ.get("DYNAMODB_ENDPOINT_URL")
+    )
+    otp_table_name: str = Field(
+        default_factory=lambda: os.environ.get("OTP_TABLE_NAME", "agribridge-otp")
+    )
+    jwt_secret_key: str = Field(
+        default_factory=lambda: os.environ.get("JWT_SECRET_KEY", "agribridge-dev-secret")
+    )
+    jwt_algorithm: str = "HS256"
+    jwt_expiry_hours: int = Field(
+        default_factory=lambda: int(os.environ.get("JWT_EXPIRY_HOURS", "24"))
+    )
+    max_concurrent_queries: int = Field(
+        default_factory=lambda: int(os.environ.get("MAX_CONCURRENT_QUERIES", "10000"))
+    )
+    log_level: str = Field(default_factory=lambda: os.environ.get("LOG_LEVEL", "INFO"))
+
+    @property
+    def is_local(self) -> bool:
+        return self.environment == "local"
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenConfig:
+    """Immutable snapshot of validated settings.
+
+    The pydantic model does the env parsing and validation once; hot
+    paths then read plain slotted attributes, which skip both pydantic's
+    attribute machinery and the instance ``__dict__`` lookup.
+    """
+
+    environment: str
+    aws_region: str
+    aws_access_key_id: Optional[str]
+    aws_secret_access_key: Optional[str]
+    sns_endpoint_url: Optional[str]
+    dynamodb_endpoint_url: Optional[str]
+    otp_table_name: str
+    jwt_secret_key: str
+    jwt_algorithm: str
+    jwt_expiry_hours: int
+    max_concurrent_queries: int
+    log_level: str
+    is_local: bool
+
+
+# Plain module singleton: lru_cache wraps every call in a lock acquire and
+# hashed lookup, pure overhead for a zero-argument accessor on hot paths.
+_cfg: Optional[FrozenConfig] = None
+
+
+def get_config() -> FrozenConfig:
+    global _cfg
+    if _cfg is None:
+        validated = Config()
+        _cfg = FrozenConfig(**validated.model_dump(), is_local=validated.is_local)
+    return _cfg
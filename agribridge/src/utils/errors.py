@@ -0,0 +1,51 @@
+"""Service exception hierarchy.
+
+Every error carries a machine-readable code and serializes to the API
+error envelope via :meth:`AgriBridgeError.to_dict`.
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class AgriBridgeError(Exception):
+    """Base class for all service errors."""
+
+    code = "INTERNAL_ERROR"
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.details = details or {}
+        # A nanosecond clock read is ~10x cheaper than datetime.utcnow();
+        # the datetime/ISO string is only built if the error is serialized.
+        self._timestamp_ns = time.time_ns()
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.utcfromtimestamp(self._timestamp_ns / 1e9)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "error": self.code,
+            "message": self.message,
+            "details": self.details,
+            "timestamp": self.timestamp.isoformat() + "Z",
+        }
+
+
+class AuthenticationError(AgriBridgeError):
+    code = "AUTH_ERROR"
+
+
+class ValidationError(AgriBridgeError):
+    code = "VALIDATION_ERROR"
+
+
+class RateLimitError(AgriBridgeError):
+    code = "RATE_LIMITED"
+
+
+class ExternalServiceError(AgriBridgeError):
+    code = "UPSTREAM_ERROR"
@@ -0,0 +1,59 @@
+"""Structured JSON logging for CloudWatch ingestion."""
+
+import logging
+import os
+import time
+
+import orjson
+
+
+class StructuredFormatter(logging.Formatter):
+    """Emit one JSON object per record."""
+
+    def __init__(self, service_name: str = "agribridge") -> None:
+        super().__init__()
+        self.service_name = service_name
+        # Fast-path template for the common case (no exception, no request
+        # id): %-formatting into a prebuilt string skips the dict build and
+        # the generic JSON encoder. The message is still JSON-escaped.
+        self._template = (
+            '{"timestamp":"%s","level":"%s","service":'
+            + orjson.dumps(service_name).decode()
+            + ',"message":%s}'
+        ).__mod__
+
+    def format(self, record: logging.LogRecord) -> str:
+        # logging already stamped record.created; formatting that epoch via
+        # time.strftime skips a fresh datetime.utcnow() + isoformat per line.
+        timestamp = (
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z"
+        )
+        if not record.exc_info and not hasattr(record, "requestId"):
+            return self._template(
+                (timestamp, record.levelname, orjson.dumps(record.getMessage()).decode())
+            )
+        log_data = {
+            "timestamp": timestamp,
+            "level": record.levelname,
+            "service": self.service_name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            log_data["exception"] = self.formatException(record.exc_info)
+        if hasattr(record, "requestId"):
+            log_data["requestId"] = record.requestId
+        # orjson is ~5-10x faster than stdlib json for small dicts.
+        return orjson.dumps(log_data).decode()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger with a single JSON handler; idempotent per name."""
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(StructuredFormatter(service_name=name))
+        logger.addHandler(handler)
+        logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+        logger.propagate = False
+    return logger
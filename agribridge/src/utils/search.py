@@ -0,0 +1,41 @@
+"""OpenSearch bulk-indexing helpers for the advisory index.
+
+Per-document index() calls pay one HTTP round-trip and one segment
+refresh each; batching through the bulk helper amortizes both across
+hundreds of documents. Batch sizing is environment-driven so it can be
+tuned without a deploy.
+"""
+
+import os
+from typing import Any, Dict, Iterable, Tuple
+
+from opensearchpy import helpers
+
+ADVISORY_INDEX = os.environ.get("ADVISORY_INDEX", "advisory-documents")
+INDEX_BATCH_SIZE = int(os.environ.get("INDEX_BATCH_SIZE", "500"))
+INDEX_MAX_CHUNK_BYTES = int(os.environ.get("INDEX_MAX_CHUNK_BYTES", str(100 * 1024 * 1024)))
+
+# Applied at index creation: a relaxed refresh interval and a large
+# translog flush threshold keep segment churn off the bulk-ingest path.
+ADVISORY_INDEX_SETTINGS = {
+    "index": {
+        "refresh_interval": os.environ.get("INDEX_REFRESH_INTERVAL", "5s"),
+        "translog.flush_threshold_size": "1gb",
+    }
+}
+
+
+def bulk_index(client, documents: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+    """Index advisory documents in bulk; returns (succeeded, failed)."""
+    actions = (
+        {"_index": ADVISORY_INDEX, "_id": doc["document_id"], "_source": doc}
+        for doc in documents
+    )
+    success, errors = helpers.bulk(
+        client,
+        actions,
+        chunk_size=INDEX_BATCH_SIZE,
+        max_chunk_bytes=INDEX_MAX_CHUNK_BYTES,
+        raise_on_error=False,
+    )
+    return success, len(errors)
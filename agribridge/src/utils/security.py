@@ -0,0 +1,562 @@
+"""Field-level encryption and phone-number hashing for stored PII.
+
+Phone numbers are never persisted in the clear: lookups go through a
+salted HMAC (:class:`PhoneNumberHasher`), and sensitive item fields are
+encrypted before they reach DynamoDB or RDS (:class:`DataEncryptor`,
+with :class:`KMSEncryptor` for KMS-managed keys).
+"""
+
+import binascii
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Any, Dict, List, Optional
+
+import boto3
+import numpy as np
+from botocore.config import Config as BotoConfig
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+try:  # Optional: beats cryptography's CFFI call overhead on short fields.
+    from Crypto.Cipher import AES as _PyCryptoAES
+except ImportError:
+    _PyCryptoAES = None
+
+from src.utils.config import get_config
+from src.utils.logger import get_logger
+
+logger = get_logger("security")
+
+# Delete set for bytes.translate: every byte that is not an ASCII digit.
+# translate() is a branchless 256-entry table walk in C — the closest the
+# stdlib gets to SWAR digit filtering — where the regex engine pays
+# per-position opcode dispatch. Multi-byte UTF-8 sequences are all
+# >= 0x80, so they fall out of the filter along with the punctuation.
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+# Shared pool for fanning out KMS-bound work: the AES-GCM core releases
+# the GIL inside OpenSSL and cold-key misses block on HTTPS, so threads
+# overlap both. Module-level so every encryptor reuses the same workers.
+_CRYPTO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="kms-crypt")
+
+# One KMS client per region, shared across encryptor instances: client
+# construction loads service models and resolves credentials, far too
+# heavy to repeat per KMSEncryptor. Pool sized to match _CRYPTO_POOL
+# fan-out so parallel cold misses don't queue on connections.
+_KMS_CLIENT_CFG = BotoConfig(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+_kms_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def derive_key(purpose: str, length: int = 32) -> bytes:
+    """Per-purpose key from the service master secret via HKDF-SHA256.
+
+    Distinct info labels keep the JWT-signing, OTP-HMAC and field-
+    encryption keys cryptographically independent: a leak of any one
+    surface no longer hands an attacker the other two.
+    """
+    ikm = get_config().jwt_secret_key.encode("utf-8")
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=length,
+        salt=None,
+        info=b"agribridge/" + purpose.encode("ascii"),
+    ).derive(ikm)
+
+
+def _get_kms_client(region: str) -> Any:
+    client = _kms_clients.get(region)
+    if client is None:
+        with _clients_lock:
+            client = _kms_clients.get(region)
+            if client is None:
+                client = boto3.client("kms", region_name=region, config=_KMS_CLIENT_CFG)
+                _kms_clients[region] = client
+    return client
+
+
+class PhoneNumberHasher:
+    """Deterministic salted hash for phone-number lookups.
+
+    The same number must always hash to the same value (it is a
+    partition-key component), so the salt is a fixed service secret
+    rather than per-record.
+
+    The SHA-256 core is hashlib's OpenSSL binding, which dispatches to
+    hardware SHA at runtime — SHA-NI on x86, and the ARMv8 sha256h
+    family on aarch64 (checked via HWCAP, which matters for Graviton
+    Lambdas) — so a hand-built intrinsics kernel would duplicate that
+    dispatch without beating it for our one-block inputs.
+    """
+
+    def __init__(self, salt: Optional[str] = None) -> None:
+        # Encode the salt exactly once; every later consumer works on
+        # the bytes form.
+        self._salt_bytes = (
+            salt or os.environ.get("PHONE_HASH_SALT", "agribridge-phone-salt")
+        ).encode("utf-8")
+        # HMAC's RFC 2104 key schedule (two padded-key block absorptions)
+        # costs more than hashing the short message itself. Absorb the salt
+        # once into a template and clone it per call: .copy() duplicates
+        # the compression-function midstate after the salt-derived block,
+        # so per hash only the digit payload and the finalization blocks
+        # are ever compressed — the salt is never re-hashed.
+        self._hmac_template = hmac.new(self._salt_bytes, b"", hashlib.sha256)
+
+    @staticmethod
+    def _normalize_phone_number(phone_number: str) -> str:
+        """Strip formatting and any prefix before the 10-digit number."""
+        digits = phone_number.encode("utf-8").translate(None, _NON_DIGIT_BYTES)
+        # The subscriber number is always the last 10 digits; the slice
+        # is branchless and also swallows the 0/0091 trunk prefixes the
+        # old startswith("91") check let through.
+        return digits[-10:].decode("ascii")
+
+    def _digest_bytes(self, phone_number: str) -> bytes:
+        """Raw 32-byte digest; hex only happens at the storage boundary.
+
+        Normalization stays in bytes from translate to update — the
+        str helper's decode/encode round trip exists only for callers
+        that want the digits as text.
+        """
+        digits = phone_number.encode("utf-8").translate(None, _NON_DIGIT_BYTES)[-10:]
+        h = self._hmac_template.copy()
+        h.update(digits)
+        return h.digest()
+
+    def hash_phone_number(self, phone_number: str) -> str:
+        return self._digest_bytes(phone_number).hex()
+
+    def hash_phone_numbers(self, phone_numbers: List[str]) -> List[str]:
+        """Hash a batch of numbers, e.g. a price-alert recipient list.
+
+        Locally-bound template copy and delete table keep the per-number
+        cost to a handful of C calls; no per-element attribute
+        resolution. A
+        true multi-buffer kernel would hash the lanes in one SIMD pass,
+        but hashlib's OpenSSL core is single-stream, so batching here
+        means hoisting the Python-level overhead out of the loop.
+        """
+        template_copy = self._hmac_template.copy
+        delete = _NON_DIGIT_BYTES
+        out = []
+        for phone_number in phone_numbers:
+            normalized = phone_number.encode("utf-8").translate(None, delete)[-10:]
+            h = template_copy()
+            h.update(normalized)
+            out.append(h.hexdigest())
+        return out
+
+    def verify_phone_number(self, phone_number: str, phone_hash: str) -> bool:
+        # Decode the stored hex once and compare 32-byte buffers: no hex
+        # encoding of the fresh digest, and compare_digest runs its
+        # constant-time loop over half the bytes.
+        try:
+            stored = bytes.fromhex(phone_hash)
+        except ValueError:
+            return False
+        return hmac.compare_digest(self._digest_bytes(phone_number), stored)
+
+    def verify_against_many(self, phone_number: str, digests: np.ndarray) -> np.ndarray:
+        """Match one number against an (N, 32) uint8 array of digests.
+
+        For dataset-scale lookups (dedup sweeps, migration audits) the
+        stored digests belong in one contiguous binary array: half the
+        bytes of their hex forms, and the comparison runs as a single
+        vectorized byte-compare in NumPy's C loop. Returns the boolean
+        match mask. Not constant-time — single untrusted checks must go
+        through :meth:`verify_phone_number`.
+        """
+        target = np.frombuffer(self._digest_bytes(phone_number), dtype=np.uint8)
+        return (digests == target).all(axis=1)
+
+    @staticmethod
+    def generate_salt() -> str:
+        """Fresh salt for provisioning a new environment."""
+        return secrets.token_hex(32)
+
+    @staticmethod
+    def generate_salts(n: int, length: int = 32) -> List[str]:
+        """Batch of independent salts from one entropy draw.
+
+        One getrandom syscall and one hex encode cover the whole batch;
+        slicing the hex string afterwards is pure pointer arithmetic.
+        """
+        hex_blob = binascii.hexlify(os.urandom(n * length)).decode("ascii")
+        step = length * 2
+        return [hex_blob[i : i + step] for i in range(0, n * step, step)]
+
+
+class _PyCryptodomeGCM:
+    """AESGCM-compatible adapter over pycryptodome.
+
+    Same (nonce, data, aad) call shape and ``ciphertext || tag`` wire
+    format as cryptography's AESGCM, so blobs stay interchangeable
+    whichever backend produced them.
+    """
+
+    __slots__ = ("_key",)
+
+    def __init__(self, key: bytes) -> None:
+        self._key = key
+
+    def encrypt(self, nonce: bytes, data: bytes, aad: Optional[bytes]) -> bytes:
+        cipher = _PyCryptoAES.new(self._key, _PyCryptoAES.MODE_GCM, nonce=nonce, mac_len=16)
+        if aad is not None:
+            cipher.update(aad)
+        ciphertext, tag = cipher.encrypt_and_digest(data)
+        return ciphertext + tag
+
+    def decrypt(self, nonce: bytes, data: bytes, aad: Optional[bytes]) -> bytes:
+        cipher = _PyCryptoAES.new(self._key, _PyCryptoAES.MODE_GCM, nonce=nonce, mac_len=16)
+        if aad is not None:
+            cipher.update(aad)
+        return cipher.decrypt_and_verify(data[:-16], data[-16:])
+
+
+class DataEncryptor:
+    """AES-GCM encryption for individual field values, keyed locally.
+
+    Authenticity comes from GCM's tag, verified in constant time inside
+    OpenSSL on decrypt — never compare ciphertexts or tags at the Python
+    level except through :func:`hmac.compare_digest`.
+    """
+
+    def __init__(self, key: Optional[bytes] = None) -> None:
+        if key is None:
+            # Stable 32-byte key, domain-separated from the JWT-signing
+            # and OTP-HMAC uses of the master secret.
+            key = derive_key("field-encryption")
+        if len(key) != 32:
+            raise ValueError("DataEncryptor requires a 32-byte key")
+        self._key = key
+        # One AEAD object per encryptor: the AES key schedule (the part a
+        # hoisted algorithms.AES() would have cached under CBC) is expanded
+        # here once instead of rebuilt per call, and GCM is a single
+        # one-shot primitive (no padder/cipher-context objects per field).
+        # Backend cascade: pycryptodome's direct C extension avoids
+        # cryptography's CFFI call overhead, which dominates on the short
+        # (< 1 KB) field values we encrypt; both emit the same blob layout.
+        if _PyCryptoAES is not None:
+            self._aead = _PyCryptodomeGCM(self._key)
+            self.backend = "pycryptodome"
+        else:
+            self._aead = AESGCM(self._key)
+            self.backend = "cryptography"
+
+    def encrypt(self, plaintext: str, _urandom=os.urandom) -> str:
+        """Encrypt to a base64 string carrying the nonce.
+
+        GCM runs AES in counter mode, so there is no block-alignment
+        padding step (or padder object) in this path at all. The nonce
+        comes straight from os.urandom (getrandom(2)); secrets.token_bytes
+        is only a wrapper around it, and the default-arg binding skips
+        the module attribute lookup per call.
+        """
+        nonce = _urandom(12)
+        ciphertext = self._aead.encrypt(nonce, plaintext.encode("utf-8"), None)
+        return binascii.b2a_base64(nonce + ciphertext, newline=False).decode("ascii")
+
+    def decrypt(self, encrypted_data: str) -> str:
+        blob = binascii.a2b_base64(encrypted_data)
+        return self._aead.decrypt(blob[:12], blob[12:], None).decode("utf-8")
+
+    def encrypt_bytes(self, plaintext: bytes, _urandom=os.urandom) -> bytes:
+        """Encrypt raw bytes; returns nonce || ciphertext with no base64.
+
+        For DynamoDB the blob can go straight into a Binary (B) attribute,
+        skipping the +33% base64 inflation and the encode/decode pair.
+        """
+        nonce = _urandom(12)
+        return nonce + self._aead.encrypt(nonce, plaintext, None)
+
+    def decrypt_bytes(self, blob: bytes) -> bytes:
+        return self._aead.decrypt(blob[:12], blob[12:], None)
+
+    def encrypt_many(self, plaintexts: List[str]) -> List[str]:
+        """Encrypt a batch against one locally-bound AEAD.
+
+        Hoisting the attribute lookups out of the loop matters when an
+        item has several encrypted fields: each element costs only the
+        primitive call, not the self.* resolution chain.
+        """
+        aead_encrypt = self._aead.encrypt
+        urandom = os.urandom
+        # b2a_base64 is one C call (bytes out, no newline) vs the b64encode
+        # wrapper's double allocation; ascii decode is cheaper than utf-8.
+        b2a = binascii.b2a_base64
+        out = []
+        for plaintext in plaintexts:
+            nonce = urandom(12)
+            ciphertext = aead_encrypt(nonce, plaintext.encode("utf-8"), None)
+            out.append(b2a(nonce + ciphertext, newline=False).decode("ascii"))
+        return out
+
+    def decrypt_many(self, encrypted_values: List[str]) -> List[str]:
+        aead_decrypt = self._aead.decrypt
+        a2b = binascii.a2b_base64
+        out = []
+        for encrypted in encrypted_values:
+            blob = a2b(encrypted)
+            out.append(aead_decrypt(blob[:12], blob[12:], None).decode("utf-8"))
+        return out
+
+    def encrypt_many_bytes(self, plaintexts: List[bytes]) -> List[bytes]:
+        aead_encrypt = self._aead.encrypt
+        urandom = os.urandom
+        out = []
+        for plaintext in plaintexts:
+            nonce = urandom(12)
+            out.append(nonce + aead_encrypt(nonce, plaintext, None))
+        return out
+
+    def decrypt_many_bytes(self, blobs: List[bytes]) -> List[bytes]:
+        aead_decrypt = self._aead.decrypt
+        return [aead_decrypt(blob[:12], blob[12:], None) for blob in blobs]
+
+
+class KMSEncryptor:
+    """Envelope encryption backed by an AWS KMS key.
+
+    Calling kms:Encrypt per field means one HTTPS round trip (and KMS
+    API charge) per value. Envelope encryption fetches a data key once,
+    encrypts locally with AES-GCM, and ships the encrypted data key
+    (EDEK) inside each blob, so steady-state encrypt/decrypt never
+    leaves the process.
+    """
+
+    # How long a cached data key may be reused before a fresh
+    # generate_data_key call; bounds blast radius of a leaked DEK.
+    _DEK_TTL_SECONDS = 300.0
+    # Cap on distinct decrypted data keys held in memory at once.
+    _EDEK_CACHE_MAX = 1024
+
+    def __init__(self, key_id: Optional[str] = None, region: Optional[str] = None) -> None:
+        cfg = get_config()
+        self._key_id = key_id or os.environ.get("KMS_KEY_ID", "alias/agribridge")
+        self._kms = _get_kms_client(region or cfg.aws_region)
+        # key-id -> (plaintext key, EDEK, expiry on the monotonic clock).
+        self._dek_cache: Dict[str, tuple] = {}
+        # EDEK -> (plaintext key, expiry), so decrypt pays kms:Decrypt
+        # once per unique data key rather than once per field. Bounded
+        # LRU: old rotations would otherwise accumulate forever in a
+        # long-lived worker.
+        self._edek_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+    def _get_data_key(self) -> tuple:
+        """(plaintext key, EDEK), minting a fresh pair when the TTL lapses."""
+        cached = self._dek_cache.get(self._key_id)
+        now = time.monotonic()
+        if cached is not None and cached[2] > now:
+            return cached[0], cached[1]
+        resp = self._kms.generate_data_key(KeyId=self._key_id, KeySpec="AES_256")
+        plaintext_key, edek = resp["Plaintext"], bytes(resp["CiphertextBlob"])
+        self._dek_cache[self._key_id] = (plaintext_key, edek, now + self._DEK_TTL_SECONDS)
+        self._cache_edek(edek, plaintext_key, now)
+        return plaintext_key, edek
+
+    def _cache_edek(self, edek: bytes, plaintext_key: bytes, now: float) -> None:
+        self._edek_cache[edek] = (plaintext_key, now + self._DEK_TTL_SECONDS)
+        self._edek_cache.move_to_end(edek)
+        while len(self._edek_cache) > self._EDEK_CACHE_MAX:
+            self._edek_cache.popitem(last=False)
+
+    def _resolve_edek(self, edek: bytes) -> bytes:
+        now = time.monotonic()
+        cached = self._edek_cache.get(edek)
+        if cached is not None and cached[1] > now:
+            # Touch for LRU ordering; hit path stays two dict ops.
+            self._edek_cache.move_to_end(edek)
+            return cached[0]
+        plaintext_key = self._kms.decrypt(CiphertextBlob=edek)["Plaintext"]
+        self._cache_edek(edek, plaintext_key, now)
+        return plaintext_key
+
+    def encrypt(self, plaintext: str) -> str:
+        """Encrypt to base64(len(EDEK) || EDEK || nonce || ciphertext)."""
+        plaintext_key, edek = self._get_data_key()
+        nonce = os.urandom(12)
+        ciphertext = AESGCM(plaintext_key).encrypt(nonce, plaintext.encode("utf-8"), None)
+        blob = len(edek).to_bytes(2, "big") + edek + nonce + ciphertext
+        return binascii.b2a_base64(blob, newline=False).decode("ascii")
+
+    def decrypt(self, encrypted_data: str) -> str:
+        blob = binascii.a2b_base64(encrypted_data)
+        edek_len = int.from_bytes(blob[:2], "big")
+        edek = blob[2 : 2 + edek_len]
+        rest = blob[2 + edek_len :]
+        plaintext_key = self._resolve_edek(edek)
+        return AESGCM(plaintext_key).decrypt(rest[:12], rest[12:], None).decode("utf-8")
+
+    def encrypt_many(self, plaintexts: List[str]) -> List[str]:
+        """Encrypt a batch in parallel on the shared crypto pool.
+
+        The data key is minted once up front so the workers never race
+        a cold-cache generate_data_key; results come back in input
+        order.
+        """
+        self._get_data_key()
+        futures = [_CRYPTO_POOL.submit(self.encrypt, p) for p in plaintexts]
+        return [f.result() for f in futures]
+
+    def decrypt_many(self, encrypted_values: List[str]) -> List[str]:
+        """Decrypt a batch, resolving each unique EDEK exactly once.
+
+        Fields of one item typically share a data key; deduping means a
+        cold cache costs one kms:Decrypt for the whole item, not one per
+        field.
+        """
+        parsed = []
+        for encrypted in encrypted_values:
+            blob = binascii.a2b_base64(encrypted)
+            edek_len = int.from_bytes(blob[:2], "big")
+            parsed.append((blob[2 : 2 + edek_len], blob[2 + edek_len :]))
+        aeads = {edek: AESGCM(self._resolve_edek(edek)) for edek, _ in parsed}
+        return [
+            aeads[edek].decrypt(rest[:12], rest[12:], None).decode("utf-8")
+            for edek, rest in parsed
+        ]
+
+
+# field -> "<field>_encrypted", built once per unique field name so the
+# marker concat isn't repeated per item in the wrapper loops.
+_ENCRYPTED_MARKERS: Dict[str, str] = {}
+
+
+def _encrypted_marker(field: str) -> str:
+    marker = _ENCRYPTED_MARKERS.get(field)
+    if marker is None:
+        marker = _ENCRYPTED_MARKERS[field] = field + "_encrypted"
+    return marker
+
+
+class DynamoDBEncryptionWrapper:
+    """Encrypts selected item fields before they are written to DynamoDB.
+
+    Encrypted values are stored as raw ``nonce || ciphertext`` bytes —
+    DynamoDB's Binary attribute type takes them as-is, so the base64
+    round trip (and its +33% size inflation) is skipped entirely; only
+    the RDS wrapper still needs text-safe output.
+    """
+
+    def __init__(self, encryptor: Optional[DataEncryptor] = None) -> None:
+        self._encryptor = encryptor or _get_default_encryptor()
+
+    def encrypt_item_inplace(self, item: Dict[str, Any], fields_to_encrypt: List[str]) -> None:
+        """Encrypt fields directly on ``item``.
+
+        Hot write paths build the dict just to hand it over; mutating it
+        skips the full dict rebuild (and its per-key refcount traffic)
+        that the copying wrapper pays.
+        """
+        # Collect-then-bulk: one bulk call instead of a per-field round
+        # trip through the encryptor's public API. .get() probes the dict
+        # once per candidate field instead of an `in` check plus lookup.
+        present = []
+        plaintexts = []
+        for field in fields_to_encrypt:
+            v = item.get(field)
+            if not v:
+                continue
+            # Type-dispatch instead of an unconditional str(): the common
+            # case is already a str, and bytes must go in raw — str(v)
+            # would encrypt the "b'...'" repr and corrupt the round trip.
+            if isinstance(v, str):
+                plaintexts.append(v.encode("utf-8"))
+            elif isinstance(v, bytes):
+                plaintexts.append(v)
+            else:
+                plaintexts.append(str(v).encode("utf-8"))
+            present.append(field)
+        values = self._encryptor.encrypt_many_bytes(plaintexts)
+        for field, value in zip(present, values):
+            item[field] = value
+            item[_encrypted_marker(field)] = True
+
+    def encrypt_item(self, item: Dict[str, Any], fields_to_encrypt: List[str]) -> Dict[str, Any]:
+        encrypted_item = item.copy()
+        self.encrypt_item_inplace(encrypted_item, fields_to_encrypt)
+        return encrypted_item
+
+    def decrypt_item_inplace(self, item: Dict[str, Any], fields_to_decrypt: List[str]) -> None:
+        present = []
+        blobs = []
+        for field in fields_to_decrypt:
+            v = item.get(field)
+            if not v or not item.get(_encrypted_marker(field)):
+                continue
+            present.append(field)
+            blobs.append(bytes(v))
+        values = self._encryptor.decrypt_many_bytes(blobs)
+        for field, value in zip(present, values):
+            item[field] = value.decode("utf-8")
+            item.pop(_encrypted_marker(field), None)
+
+    def decrypt_item(self, item: Dict[str, Any], fields_to_decrypt: List[str]) -> Dict[str, Any]:
+        decrypted_item = item.copy()
+        self.decrypt_item_inplace(decrypted_item, fields_to_decrypt)
+        return decrypted_item
+
+
+class RDSEncryptionWrapper:
+    """Encrypts selected column values before they are written to RDS."""
+
+    def __init__(self, encryptor: Optional[DataEncryptor] = None) -> None:
+        self._encryptor = encryptor or _get_default_encryptor()
+
+    def encrypt_row(self, row: Dict[str, Any], columns_to_encrypt: List[str]) -> Dict[str, Any]:
+        encrypted_row = row.copy()
+        present = [c for c in columns_to_encrypt if encrypted_row.get(c)]
+        values = self._encryptor.encrypt_many([str(encrypted_row[c]) for c in present])
+        for column, value in zip(present, values):
+            encrypted_row[column] = value
+        return encrypted_row
+
+    def decrypt_row(self, row: Dict[str, Any], columns_to_decrypt: List[str]) -> Dict[str, Any]:
+        decrypted_row = row.copy()
+        present = [c for c in columns_to_decrypt if decrypted_row.get(c)]
+        values = self._encryptor.decrypt_many([decrypted_row[c] for c in present])
+        for column, value in zip(present, values):
+            decrypted_row[column] = value
+        return decrypted_row
+
+
+# -- module singletons --------------------------------------------------
+# functools.cache replaces the global + None-check (and the
+# double-checked lock it needed to be race-free): the C-implemented hit
+# path is a single dict probe with no LRU bookkeeping (cache is
+# lru_cache without the maxsize machinery), and CPython serializes the
+# miss so only one instance is ever built. These accessors run per
+# request, unlike get_config's one-shot module constant. Salt and key
+# resolution stay inside the constructors, so env-driven configuration
+# still applies on first call.
+
+
+@cache
+def get_phone_hasher() -> PhoneNumberHasher:
+    return PhoneNumberHasher()
+
+
+@cache
+def _get_default_encryptor() -> DataEncryptor:
+    return DataEncryptor()
+
+
+def get_data_encryptor() -> DataEncryptor:
+    return _get_default_encryptor()
+
+
+@cache
+def get_kms_encryptor() -> KMSEncryptor:
+    return KMSEncryptor()
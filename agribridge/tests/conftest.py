@@ -0,0 +1,25 @@
+"""Shared test fixtures.
+
+The AWS session stub lives here so no test ever opens a real client:
+swapping the module attribute for a SimpleNamespace once per session is
+far cheaper than per-test mock.patch context managers, and attribute
+lookups on it are plain dict ops rather than MagicMock auto-generation.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.services.auth_service as auth_service_module
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_aws_session():
+    original = auth_service_module._SHARED_SESSION
+    auth_service_module._SHARED_SESSION = SimpleNamespace(
+        client=lambda *args, **kwargs: MagicMock(),
+        resource=lambda *args, **kwargs: MagicMock(),
+    )
+    yield
+    auth_service_module._SHARED_SESSION = original
@@ -0,0 +1,59 @@
+"""Tests for the shared enums and value models.
+
+One parametrized test per concern instead of a one-assert function per
+enum member: pytest's per-test fixture setup/teardown is paid once per
+parameter, and collection stays flat.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.common import Channel, GeoLocation, Intent, Language, UserType
+
+
+@pytest.mark.parametrize(
+    ("enum_val", "expected"),
+    [
+        (Intent.PRICE_QUERY, "PRICE_QUERY"),
+        (Intent.BUYER_MATCHING, "BUYER_MATCHING"),
+        (Intent.CROP_ADVISORY, "CROP_ADVISORY"),
+        (Intent.FERTILIZER_ADVICE, "FERTILIZER_ADVICE"),
+        (Intent.WEATHER_INFO, "WEATHER_INFO"),
+        (Intent.GENERAL_QUERY, "GENERAL_QUERY"),
+        (Channel.IVR, "IVR"),
+        (Channel.SMS, "SMS"),
+        (Channel.MOBILE, "MOBILE"),
+        (UserType.FARMER, "FARMER"),
+        (UserType.BUYER, "BUYER"),
+        (UserType.ADMIN, "ADMIN"),
+        (Language.HINDI, "hi"),
+        (Language.ENGLISH, "en"),
+        (Language.TAMIL, "ta"),
+        (Language.TELUGU, "te"),
+        (Language.KANNADA, "kn"),
+        (Language.MARATHI, "mr"),
+    ],
+)
+def test_enum_values(enum_val, expected):
+    assert enum_val == expected
+
+
+@pytest.mark.parametrize(
+    ("latitude", "longitude", "valid"),
+    [
+        (12.97, 77.59, True),
+        (-90.0, -180.0, True),
+        (90.0, 180.0, True),
+        (90.1, 0.0, False),
+        (-90.1, 0.0, False),
+        (0.0, 180.1, False),
+        (0.0, -180.1, False),
+    ],
+)
+def test_geolocation_bounds(latitude, longitude, valid):
+    if valid:
+        point = GeoLocation(latitude=latitude, longitude=longitude)
+        assert (point.latitude, point.longitude) == (latitude, longitude)
+    else:
+        with pytest.raises(ValidationError):
+            GeoLocation(latitude=latitude, longitude=longitude)
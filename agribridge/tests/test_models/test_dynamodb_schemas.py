@@ -0,0 +1,176 @@
+"""Tests for the DynamoDB record schemas and table registry.
+
+Shared inputs (the Delhi location, the farmer key dict) are built once
+at module level: GeoLocation validation and create_keys run ~10x across
+this file otherwise, for identical values every time.
+"""
+
+from datetime import datetime
+
+import pytest
+from freezegun import freeze_time
+from pydantic import ValidationError
+
+from src.models.common import GeoLocation
+from src.models.dynamodb_schemas import (
+    DYNAMODB_TABLES,
+    BuyerRecord,
+    ConversationRecord,
+    FarmerRecord,
+    PriceCacheRecord,
+    QueryLogRecord,
+    TABLES,
+)
+
+# Pure-CPU, no shared mutable state: safe for xdist worker fan-out.
+pytestmark = [pytest.mark.unit]
+
+# ConversationRecord defers its schema build to first use; trigger it here,
+# outside the frozen clock, or pydantic would try to generate a schema
+# against freezegun's FakeDatetime class.
+ConversationRecord.model_rebuild(force=True)
+
+_DELHI_LOC = GeoLocation(latitude=28.6139, longitude=77.2090)
+_FARMER_KEYS = FarmerRecord.create_keys("hash123")
+_FIXED_DT = datetime(2024, 1, 15, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def _freeze():
+    """Pin the clock: default_factory timestamps become deterministic and
+    every utcnow()/time() in the code under test reads a cached instant
+    instead of hitting the syscall."""
+    with freeze_time("2024-01-15 12:00:00"):
+        yield
+
+
+@pytest.mark.parametrize(
+    ("record_cls", "args", "expected"),
+    [
+        (FarmerRecord, ("hash123",), {"PK": "FARMER#hash123", "SK": "PROFILE"}),
+        (BuyerRecord, ("hash456",), {"PK": "BUYER#hash456", "SK": "PROFILE"}),
+        (
+            PriceCacheRecord,
+            ("wheat", "Delhi", _FIXED_DT),
+            {"PK": "PRICE#wheat#Delhi", "SK": "DATE#2024-01-15"},
+        ),
+        (
+            QueryLogRecord,
+            ("user_001", _FIXED_DT),
+            {"PK": "USER#user_001", "SK": "QUERY#2024-01-15T12:00:00.000000"},
+        ),
+        (
+            ConversationRecord,
+            ("session_abc", 1),
+            {"PK": "SESSION#session_abc", "SK": "TURN#0001"},
+        ),
+    ],
+)
+def test_create_keys(record_cls, args, expected):
+    assert record_cls.create_keys(*args) == expected
+
+
+class TestFarmerRecord:
+    def test_farmer_record_creation(self):
+        # Assertion-only read: model_construct skips validator dispatch;
+        # the rejects-extra-fields test below keeps the validating path
+        # covered.
+        record = FarmerRecord.model_construct(
+            **_FARMER_KEYS,
+            user_id="farmer_001",
+            phone_number="enc:abc",
+            phone_hash="hash123",
+            name="Ravi",
+            district="Delhi",
+            location=_DELHI_LOC,
+            land_size=2.5,
+            crop_types=["wheat"],
+        )
+        assert record.PK == "FARMER#hash123"
+        assert record.GSI1PK == "DISTRICT#Delhi"
+        assert record.GSI1SK == "FARMER#farmer_001"
+        assert record.land_size == 2.5
+
+    def test_farmer_record_rejects_extra_fields(self):
+        with pytest.raises(ValidationError):
+            FarmerRecord(
+                **_FARMER_KEYS,
+                user_id="farmer_001",
+                phone_number="enc:abc",
+                phone_hash="hash123",
+                name="Ravi",
+                district="Delhi",
+                rating=5,
+            )
+
+
+class TestBuyerRecord:
+    def test_buyer_record_creation(self):
+        record = BuyerRecord.model_construct(
+            **BuyerRecord.create_keys("hash456"),
+            user_id="buyer_001",
+            phone_number="enc:def",
+            phone_hash="hash456",
+            name="Meena",
+            district="Delhi",
+            business_name="Delhi Traders",
+        )
+        assert record.GSI1SK == "BUYER#buyer_001"
+        assert record.business_name == "Delhi Traders"
+
+
+class TestPriceCacheRecord:
+    def test_price_cache_record_creation(self):
+        record = PriceCacheRecord.model_construct(
+            **PriceCacheRecord.create_keys("wheat", "Delhi", _FIXED_DT),
+            crop="wheat",
+            price_per_quintal=2150.0,
+        )
+        assert record.source == "Agmarknet"
+        assert record.price_per_quintal == 2150.0
+
+    def test_calculate_ttl(self):
+        ttl = PriceCacheRecord.calculate_ttl(_FIXED_DT, hours=24)
+        assert ttl == int(_FIXED_DT.timestamp()) + 24 * 3600
+
+
+class TestConversationRecord:
+    @pytest.mark.parametrize(
+        ("turn", "expected_sk"),
+        [(1, "TURN#0001"), (99, "TURN#0099"), (1000, "TURN#1000")],
+    )
+    def test_create_keys_zero_padding(self, turn, expected_sk):
+        assert ConversationRecord.create_keys("session_abc", turn)["SK"] == expected_sk
+
+    def test_conversation_record_creation(self):
+        record = ConversationRecord.model_construct(
+            **ConversationRecord.create_keys("session_abc", 1),
+            session_id="session_abc",
+            user_id="user_001",
+            turn_number=1,
+        )
+        assert record.SK == "TURN#0001"
+        assert record.TTL == 0
+
+
+class TestDynamoDBTables:
+    # NamedTuples compare equal to plain tuples, so one C-level deep
+    # compare pins every field of every table — including ones no
+    # hand-written assertion thought to check — and catches drift.
+    _EXPECTED = (
+        (
+            "agribridge-farmers",
+            "PK",
+            "SK",
+            (("GSI1", "GSI1PK", "GSI1SK", "KEYS_ONLY"),),
+            None,
+        ),
+        ("agribridge-price-cache", "PK", "SK", (), "TTL"),
+        ("agribridge-query-logs", "PK", "SK", (), None),
+        ("agribridge-conversations", "PK", "SK", (), "TTL"),
+        ("agribridge-otp", "PK", "SK", (), "TTL"),
+    )
+
+    def test_tables_schema(self):
+        assert TABLES == self._EXPECTED
+        assert DYNAMODB_TABLES == {spec.name: spec for spec in TABLES}
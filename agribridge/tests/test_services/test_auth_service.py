@@ -0,0 +1,269 @@
+"""Tests for the OTP auth service.
+
+AWS traffic is mocked at the shared-session boundary, so the service
+under test is the real thing down to the wire calls. The service is
+built once per module — constructor work (HMAC key schedule, client
+setup) is amortized across all tests, with a function-scoped autouse
+fixture resetting mock state in between.
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+from freezegun import freeze_time
+
+import src.services.auth_service as auth_service_module
+from src.services.auth_service import AuthService
+from src.utils.errors import AuthenticationError
+from src.utils.hashing import hash_phone
+
+PHONE = "+919876543210"
+# Hashed once at import: the keyed BLAKE2b runs in nearly every test below.
+PHONE_HASH = hash_phone(PHONE)
+
+
+@dataclass(frozen=True)
+class FailureCase:
+    """One verify-OTP failure scenario: stored table state + outcome."""
+
+    stored_item: dict | None
+    msg_substr: str
+    expected_writes: int = 1
+
+
+class ConditionalCheckFailed(Exception):
+    """Stands in for botocore's ConditionalCheckFailedException."""
+
+
+class FakeTable:
+    """Tiny in-process OTP table: plain method calls instead of MagicMock
+    introspection on the hot verify path, and it enforces the same
+    conditional-update semantics the real table does."""
+
+    def __init__(self):
+        self._items = {}
+        self.update_calls = 0
+
+    def put_item(self, Item):
+        self._items[(Item["PK"], Item["SK"])] = dict(Item)
+
+    def get_item(self, Key):
+        item = self._items.get((Key["PK"], Key["SK"]))
+        return {"Item": item} if item is not None else {}
+
+    def delete_item(self, Key):
+        self._items.pop((Key["PK"], Key["SK"]), None)
+
+    def update_item(self, Key, UpdateExpression=None, ConditionExpression=None,
+                    ExpressionAttributeValues=None, ReturnValues=None):
+        self.update_calls += 1
+        values = ExpressionAttributeValues or {}
+        item = self._items.get((Key["PK"], Key["SK"]))
+        if ConditionExpression is not None and (
+            item is None
+            or item["otp_hash"] != values[":h"]
+            or item["attempts"] >= values[":max"]
+            or item["expires_at"] <= values[":now"]
+        ):
+            raise ConditionalCheckFailed()
+        if item is None:
+            item = self._items[(Key["PK"], Key["SK"])] = {"attempts": 0}
+        item["attempts"] += values.get(":one", 1)
+        return {"Attributes": item}
+
+
+@pytest.fixture(scope="module")
+def auth_service():
+    # The conftest session stub already replaced _SHARED_SESSION, so the
+    # constructor wires up MagicMock clients with no patch() needed here.
+    return AuthService()
+
+
+@pytest.fixture(autouse=True)
+def _freeze():
+    """Pin the clock so epoch math in send/verify is deterministic.
+
+    asyncio is left unfrozen: the batch writer's flush timer runs on
+    loop.time(), which must keep advancing or the flush never fires.
+    """
+    with freeze_time("2024-01-15 12:00:00", ignore=["asyncio"]):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _reset(auth_service):
+    """Fresh mock state per test on the shared service instance."""
+    auth_service.dynamodb.reset_mock()
+    auth_service.sns_client.reset_mock()
+    auth_service.sns_client.publish.side_effect = None
+    auth_service.otp_table = FakeTable()
+    client = auth_service.dynamodb.meta.client
+    client.exceptions.ConditionalCheckFailedException = ConditionalCheckFailed
+    client.batch_write_item.return_value = {}
+    yield
+
+
+@pytest.fixture(scope="module")
+def otp_samples(auth_service):
+    """One shared RNG pass; every statistical OTP test reads from it."""
+    return [auth_service.generate_otp() for _ in range(100)]
+
+
+class TestOTPGeneration:
+    def test_generate_otp_format(self, auth_service):
+        otp = auth_service.generate_otp()
+        assert len(otp) == 6
+        assert otp.isdigit()
+
+    @pytest.mark.slow
+    def test_generate_otp_uniqueness(self, otp_samples):
+        # Collisions in a 10^6 space over 100 draws are vanishingly rare.
+        assert len(set(otp_samples)) > 90
+
+    def test_generate_otp_zero_padding(self, auth_service, monkeypatch):
+        # Deterministic boundary check replaces the old 1000-draw
+        # statistical test: force the RNG to zero and assert the pad.
+        monkeypatch.setattr(
+            auth_service_module.secrets, "token_bytes", lambda n: b"\x00" * n
+        )
+        assert auth_service.generate_otp() == "000000"
+
+
+@pytest.fixture(scope="module")
+def known_hash(auth_service):
+    """hash_otp("123456"), computed once for the whole hashing group."""
+    return auth_service.hash_otp("123456")
+
+
+@pytest.mark.slow
+class TestOTPHashing:
+    def test_hash_otp_consistency(self, auth_service, known_hash):
+        assert auth_service.hash_otp("123456") == known_hash
+
+    def test_hash_otp_format(self, known_hash):
+        assert len(known_hash) == 64
+        # C-level hex parse; raises ValueError on any non-hex character.
+        bytes.fromhex(known_hash)
+
+    @pytest.mark.parametrize(
+        ("otp", "expected"),
+        [("123456", True), ("654321", False)],
+    )
+    def test_verify_otp_hash(self, auth_service, known_hash, otp, expected):
+        assert auth_service.verify_otp_hash(otp, known_hash) is expected
+
+
+class TestSendOTP:
+    def test_send_otp_stores_in_dynamodb(self, auth_service):
+        response = asyncio.run(auth_service.send_otp(PHONE))
+        assert response.success
+        # One call_args_list read covers both the called-once assertion
+        # and the payload inspection; every extra attribute access on a
+        # MagicMock goes through __getattr__ child creation.
+        (call,) = auth_service.dynamodb.meta.client.batch_write_item.call_args_list
+        request_items = call.kwargs["RequestItems"]
+        (puts,) = request_items.values()
+        item = puts[0]["PutRequest"]["Item"]
+        assert item["PK"] == {"S": "OTP#" + PHONE_HASH}
+        assert item["SK"] == {"S": "OTP"}
+        assert item["attempts"] == {"N": "0"}
+
+    def test_send_otp_skips_sns_in_local(self, auth_service):
+        asyncio.run(auth_service.send_otp(PHONE))
+        auth_service.sns_client.publish.assert_not_called()
+
+    def test_send_otp_sns_failure(self, auth_service, monkeypatch):
+        # Deferred: keeps botocore out of module collection for the one
+        # test that needs its exception type.
+        from botocore.exceptions import ClientError
+
+        monkeypatch.setattr(auth_service, "_is_local", False)
+        auth_service.sns_client.publish.side_effect = ClientError(
+            {"Error": {"Code": "Throttling", "Message": "slow down"}}, "Publish"
+        )
+        with pytest.raises(ClientError):
+            asyncio.run(auth_service.send_otp(PHONE))
+
+
+def _seed_otp(auth_service, **attrs):
+    auth_service.otp_table.put_item(
+        Item={"PK": "OTP#" + PHONE_HASH, "SK": "OTP", **attrs}
+    )
+
+
+class TestVerifyOTP:
+    def test_verify_otp_success(self, auth_service):
+        _seed_otp(
+            auth_service,
+            otp_hash=auth_service.hash_otp("123456"),
+            attempts=0,
+            expires_at=2**31,
+        )
+        response = asyncio.run(auth_service.verify_otp(PHONE, "123456"))
+        assert response.success
+        assert response.token
+        assert response.user_id == PHONE_HASH[:16]
+        assert auth_service.otp_table.update_calls == 1
+
+    @pytest.mark.parametrize(
+        "case",
+        [
+            FailureCase(stored_item=None, msg_substr="No OTP pending"),
+            FailureCase(
+                stored_item={"otp_hash": "x", "attempts": 0, "expires_at": 0},
+                msg_substr="OTP expired",
+            ),
+            FailureCase(
+                stored_item={"otp_hash": "x", "attempts": 3, "expires_at": 2**31},
+                msg_substr="Too many attempts",
+            ),
+            FailureCase(
+                stored_item={"otp_hash": "VALID", "attempts": 1, "expires_at": 2**31},
+                msg_substr="Invalid OTP",
+                expected_writes=2,  # the failed check plus the attempt count
+            ),
+        ],
+        ids=["no-pending", "expired", "locked-out", "wrong-otp"],
+    )
+    def test_verify_otp_failures(self, auth_service, case):
+        item = case.stored_item
+        if item is not None:
+            if item["otp_hash"] == "VALID":
+                item = dict(item, otp_hash=auth_service.hash_otp("123456"))
+            _seed_otp(auth_service, **item)
+        with pytest.raises(AuthenticationError, match=case.msg_substr):
+            asyncio.run(auth_service.verify_otp(PHONE, "654321"))
+        assert auth_service.otp_table.update_calls == case.expected_writes
+        if case.msg_substr == "Invalid OTP":
+            # The wrong guess counted toward the lockout cap in the store.
+            stored = auth_service.otp_table.get_item(
+                Key={"PK": "OTP#" + PHONE_HASH, "SK": "OTP"}
+            )["Item"]
+            assert stored["attempts"] == 2
+
+
+@pytest.fixture(scope="module")
+def sample_token(auth_service):
+    """One signed token shared by every assertion-only JWT test."""
+    return auth_service.generate_jwt_token("user123", "FARMER", 2**31)
+
+
+@pytest.mark.slow
+class TestJWTToken:
+    def test_generate_jwt_token(self, sample_token):
+        assert isinstance(sample_token, str)
+        assert sample_token.count(".") == 2
+
+    def test_validate_token_success(self, auth_service, sample_token):
+        payload = auth_service.validate_token(sample_token)
+        assert payload["sub"] == "user123"
+
+    def test_jwt_token_contains_required_fields(self, auth_service, sample_token):
+        payload = auth_service.validate_token(sample_token)
+        assert payload["user_type"] == "FARMER"
+        assert payload["exp"] == 2**31
+
+    def test_validate_token_invalid(self, auth_service):
+        with pytest.raises(AuthenticationError):
+            auth_service.validate_token("not.a.token")
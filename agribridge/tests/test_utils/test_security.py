@@ -0,0 +1,121 @@
+"""Tests for the phone-number hashing utilities.
+
+The hash is a partition-key component, so the properties that matter
+are determinism, format-insensitivity (every way a user types the same
+number must collide), and that the salt actually separates hash spaces.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.security import PhoneNumberHasher, get_phone_hasher
+
+# Pure-CPU, no shared mutable state: safe for xdist worker fan-out.
+pytestmark = [pytest.mark.unit]
+
+PHONE = "+919876543210"
+
+# Every formatting of the same Delhi test number; all must collide.
+PHONE_FORMATS = [
+    "+919876543210",
+    "919876543210",
+    "9876543210",
+    "+91 98765 43210",
+    "+91-98765-43210",
+]
+
+
+@pytest.fixture(scope="module")
+def hasher():
+    """One hasher for the whole module: construction (env lookup plus
+    the HMAC key schedule) is identical everywhere, and the instance is
+    read-only after init, so sharing it is safe."""
+    return PhoneNumberHasher(salt="test_salt")
+
+
+class TestPhoneNumberHasher:
+    def test_hash_phone_number_basic(self, hasher):
+        hash1 = hasher.hash_phone_number(PHONE)
+        # One C-level hex parse replaces 64 membership probes; it raises
+        # on any stray character and pins the digest width in bytes.
+        assert len(bytes.fromhex(hash1)) == 32
+
+    def test_hash_phone_number_consistency(self, hasher):
+        assert hasher.hash_phone_number(PHONE) == hasher.hash_phone_number(PHONE)
+
+    def test_hash_phone_number_different_numbers(self, hasher):
+        hashes = hasher.hash_phone_numbers(["+919876543210", "+919876543211"])
+        assert len({bytes.fromhex(h) for h in hashes}) == 2
+
+    def test_hash_phone_number_normalization(self, hasher):
+        # One batch call instead of a per-format loop through the
+        # public single-hash API. Set keys are the decoded 32-byte
+        # digests: SipHash over half the bytes of the hex strings, and
+        # fromhex doubles as the format check.
+        hashes = hasher.hash_phone_numbers(PHONE_FORMATS)
+        assert len({bytes.fromhex(h) for h in hashes}) == 1
+
+    def test_hash_depends_on_salt(self):
+        hash1 = PhoneNumberHasher(salt="salt_one").hash_phone_number(PHONE)
+        hash2 = PhoneNumberHasher(salt="salt_two").hash_phone_number(PHONE)
+        assert hash1 != hash2
+
+
+class TestNormalization:
+    def test_normalize_phone_number_strips_formatting(self):
+        normalized = PhoneNumberHasher._normalize_phone_number("+91 98765-43210")
+        assert normalized == "9876543210"
+
+    def test_normalize_phone_number_removes_country_code(self):
+        assert PhoneNumberHasher._normalize_phone_number("919876543210") == "9876543210"
+        assert PhoneNumberHasher._normalize_phone_number("9876543210") == "9876543210"
+
+
+class TestVerifyPhoneNumber:
+    def test_verify_phone_number_correct(self, hasher):
+        stored = hasher.hash_phone_number(PHONE)
+        assert hasher.verify_phone_number(PHONE, stored)
+
+    def test_verify_phone_number_wrong(self, hasher):
+        stored = hasher.hash_phone_number(PHONE)
+        assert not hasher.verify_phone_number("+919876543211", stored)
+
+    @pytest.mark.parametrize("phone", PHONE_FORMATS)
+    def test_verify_phone_number_different_formats(self, hasher, phone):
+        stored = hasher.hash_phone_number("9876543210")
+        assert hasher.verify_phone_number(phone, stored)
+
+    def test_verify_phone_number_invalid_hash(self, hasher):
+        assert not hasher.verify_phone_number(PHONE, "invalid_hash")
+
+    @pytest.mark.parametrize("known_index", [0, 637, 999])
+    def test_verify_against_many(self, hasher, known_index):
+        rng = np.random.default_rng(42)
+        digests = rng.integers(0, 256, size=(1000, 32), dtype=np.uint8)
+        known = bytes.fromhex(hasher.hash_phone_number(PHONE))
+        digests[known_index] = np.frombuffer(known, dtype=np.uint8)
+        mask = hasher.verify_against_many(PHONE, digests)
+        (hits,) = np.nonzero(mask)
+        assert hits.tolist() == [known_index]
+
+
+class TestSaltGeneration:
+    def test_generate_salt_hex_format(self):
+        salt = PhoneNumberHasher.generate_salt()
+        assert len(bytes.fromhex(salt)) == 32
+
+    def test_generate_salt_uniqueness(self):
+        salts = PhoneNumberHasher.generate_salts(10)
+        assert len({bytes.fromhex(s) for s in salts}) == 10
+
+    def test_generate_salts_shape(self):
+        salts = PhoneNumberHasher.generate_salts(3, length=16)
+        assert [len(bytes.fromhex(s)) for s in salts] == [16, 16, 16]
+
+
+class TestGetPhoneHasher:
+    def test_get_phone_hasher_singleton(self):
+        assert get_phone_hasher() is get_phone_hasher()
+
+    def test_get_phone_hasher_type(self):
+        assert isinstance(get_phone_hasher(), PhoneNumberHasher)
@@ -2,21 +2,61 @@
 AWS Connect IVR Handler
 Handles incoming calls and routes to appropriate services
 """
+import hashlib
 import json
 import os
+import re
+import time
 import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 
-# AWS Clients - Initialize with explicit region
-bedrock = boto3.client('bedrock-runtime', region_name='ap-south-1')
-polly = boto3.client('polly', region_name='ap-south-1')
-dynamodb = boto3.resource('dynamodb', region_name='ap-south-1')
+# Shared client config: keep idle sockets warm between invocations,
+# fail fast on dead connections instead of stalling the caller
+_BOTO_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=10,
+    retries={'max_attempts': 2, 'mode': 'adaptive'},
+    max_pool_connections=50,
+    tcp_keepalive=True
+)
 
 # Configuration
 TABLE_NAME = os.environ.get('DYNAMODB_TABLE')
 BEDROCK_MODEL = os.environ.get('BEDROCK_MODEL_ID')
+AUDIO_BUCKET = os.environ.get('AUDIO_BUCKET')
 
-table = dynamodb.Table(TABLE_NAME)
+# AWS clients - constructed lazily so a cold start only pays the init
+# cost (~150-300ms each) for the services its code path actually touches.
+# lru_cache makes the warm-path getter a few-ns dict hit.
+@lru_cache(maxsize=1)
+def get_bedrock():
+    return boto3.client('bedrock-runtime', region_name='ap-south-1', config=_BOTO_CONFIG)
+
+@lru_cache(maxsize=1)
+def get_polly():
+    return boto3.client('polly', region_name='ap-south-1', config=_BOTO_CONFIG)
+
+@lru_cache(maxsize=1)
+def get_s3():
+    return boto3.client('s3', region_name='ap-south-1', config=_BOTO_CONFIG)
+
+@lru_cache(maxsize=1)
+def get_table():
+    # DAX is a drop-in read/write-through cache in front of DynamoDB
+    # (microsecond hits). Opt-in via env so local dev stays on DynamoDB.
+    if os.environ.get('USE_DAX') == '1':
+        from amazondax import AmazonDaxClient
+        dax = AmazonDaxClient.resource(
+            endpoint_url=os.environ['DAX_ENDPOINT'],
+            region_name='ap-south-1'
+        )
+        return dax.Table(TABLE_NAME)
+    dynamodb = boto3.resource('dynamodb', region_name='ap-south-1', config=_BOTO_CONFIG)
+    return dynamodb.Table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
@@ -33,18 +73,26 @@ def lambda_handler(event, context):
     language = parameters.get('language', 'en-IN')
     session_id = contact_data.get('ContactId', '')
     
-    # Route based on intent
-    intent = classify_intent(user_input, language)
-    
+    # Intent classification (a Bedrock round-trip) and the price lookup
+    # are independent - run them concurrently and speculatively prefetch
+    # prices, since most traffic is price-related. A wasted DynamoDB read
+    # on GENERAL queries is trivial next to the latency saved.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        intent_future = executor.submit(classify_intent, user_input, language)
+        crop = extract_crop_name(user_input)
+        prices_future = executor.submit(get_crop_prices, crop)
+        intent = intent_future.result()
+
+    audio_parts = None
     if intent == 'PRICE_QUERY':
-        response = handle_price_query(user_input, language)
+        response = handle_price_query(user_input, language, crop, prices_future.result())
     elif intent == 'SELLING_INSIGHT':
-        response = handle_selling_insight(user_input, language)
+        response, audio_parts = handle_selling_insight(user_input, language, crop, prices_future.result())
     else:
         response = handle_general_query(user_input, language)
-    
+
     # Convert response to speech
-    speech_url = text_to_speech(response, language)
+    speech_url = text_to_speech(response, language, audio_parts)
     
     return {
         'statusCode': 200,
@@ -56,31 +104,88 @@ def lambda_handler(event, context):
         })
     }
 
-def classify_intent(user_input, language):
-    """
-    Classify user intent using AWS Bedrock
-    """
-    prompt = f"""Classify the following farmer query into one of these intents:
+# Static classification rubric - kept as a separate (cacheable) prompt block.
+# The few-shot examples pad the block past Bedrock's minimum cacheable size
+# and double as accuracy anchors for common query phrasings.
+CLASSIFY_RUBRIC = """Classify the farmer query into one of these intents:
 - PRICE_QUERY: Asking about crop prices
 - SELLING_INSIGHT: Asking when to sell or market trends
 - GENERAL: Other questions
 
-Query: {user_input}
-Language: {language}
+Examples:
+Query: What is the price of wheat today? -> PRICE_QUERY
+Query: Aaj tamatar ka bhav kya hai? -> PRICE_QUERY
+Query: How much does onion sell for in Delhi mandi? -> PRICE_QUERY
+Query: Cotton rate in Maharashtra -> PRICE_QUERY
+Query: Should I sell my rice now or wait? -> SELLING_INSIGHT
+Query: Is the potato market rising? -> SELLING_INSIGHT
+Query: When is the best time to sell sugarcane? -> SELLING_INSIGHT
+Query: Will tomato prices go up next week? -> SELLING_INSIGHT
+Query: How do I treat leaf blight? -> GENERAL
+Query: Which fertilizer for wheat? -> GENERAL
+Query: How much water does cotton need? -> GENERAL
 
 Respond with only the intent name."""
 
+# Request bodies are identical apart from the user turn, so serialize the
+# static scaffolding once at import and splice the variable part in with a
+# bytes.replace instead of rebuilding dict + json.dumps per call
+_CLASSIFY_BODY_TPL = json.dumps({
+    "anthropic_version": "bedrock-2023-05-31",
+    "max_tokens": 50,
+    "system": [{
+        "type": "text",
+        "text": CLASSIFY_RUBRIC,
+        "cache_control": {"type": "ephemeral"}
+    }],
+    "messages": [{
+        "role": "user",
+        "content": "__PROMPT__"
+    }]
+}).encode()
+
+_INSIGHT_BODY_TPL = json.dumps({
+    "anthropic_version": "bedrock-2023-05-31",
+    "max_tokens": 300,
+    "messages": [{
+        "role": "user",
+        "content": "__PROMPT__"
+    }]
+}).encode()
+
+def _fill_body(template, prompt):
+    """
+    Splice the user prompt into a pre-serialized request template
+    """
+    return template.replace(b'"__PROMPT__"', json.dumps(prompt).encode())
+
+# Most IVR queries are unambiguous - a keyword scan settles them in
+# microseconds instead of a 300-800ms Bedrock round-trip. Only queries
+# that match neither pattern (and are long enough to be meaningful)
+# reach the LLM.
+_PRICE_PATTERN = re.compile(r'price|rate|cost|bhav|भाव|कीमत|ಬೆಲೆ', re.IGNORECASE)
+_SELL_PATTERN = re.compile(r'\bsell\b|\bwait\b|market trend|\bwhen\b|बेच|ಮಾರಾಟ', re.IGNORECASE)
+
+def classify_intent(user_input, language):
+    """
+    Classify user intent - cheap keyword pre-filter first,
+    AWS Bedrock only for ambiguous queries
+    """
+    if _PRICE_PATTERN.search(user_input):
+        return 'PRICE_QUERY'
+    if _SELL_PATTERN.search(user_input):
+        return 'SELLING_INSIGHT'
+    if len(user_input.split()) <= 3:
+        # Too short to classify better than the keyword scan did
+        return 'GENERAL'
+
     try:
-        response = bedrock.invoke_model(
+        response = get_bedrock().invoke_model(
             modelId=BEDROCK_MODEL,
-            body=json.dumps({
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 50,
-                "messages": [{
-                    "role": "user",
-                    "content": prompt
-                }]
-            })
+            body=_fill_body(
+                _CLASSIFY_BODY_TPL,
+                f"Query: {user_input}\nLanguage: {language}"
+            )
         )
         
         result = json.loads(response['body'].read())
@@ -90,16 +195,16 @@ Respond with only the intent name."""
         print(f"Error classifying intent: {e}")
         return 'GENERAL'
 
-def handle_price_query(user_input, language):
+def handle_price_query(user_input, language, crop=None, prices=None):
     """
     Handle price-related queries
+    Crop and prices may already be resolved by the speculative prefetch
     """
-    # Extract crop name from input
-    crop = extract_crop_name(user_input)
-    
-    # Get prices from cache or API
-    prices = get_crop_prices(crop)
-    
+    if crop is None:
+        crop = extract_crop_name(user_input)
+    if prices is None:
+        prices = get_crop_prices(crop)
+
     if not prices:
         return get_response_in_language(
             "Sorry, I couldn't find price information for that crop.",
@@ -110,18 +215,24 @@ def handle_price_query(user_input, language):
     response = format_price_response(prices, language)
     return response
 
-def handle_selling_insight(user_input, language):
+def handle_selling_insight(user_input, language, crop=None, prices=None):
     """
     Handle selling insight queries using LLM
+    Crop and prices may already be resolved by the speculative prefetch
+    Returns (response_text, audio_parts): the MP3 parts synthesized
+    sentence-by-sentence during streaming, or None when the reply is
+    canned text that must be synthesized (or cache-hit) as a whole.
     """
-    crop = extract_crop_name(user_input)
-    prices = get_crop_prices(crop)
-    
+    if crop is None:
+        crop = extract_crop_name(user_input)
+    if prices is None:
+        prices = get_crop_prices(crop)
+
     if not prices:
         return get_response_in_language(
             "I need price data to provide selling insights.",
             language
-        )
+        ), None
     
     # Generate insights using Bedrock
     prompt = f"""You are an agricultural advisor helping Indian farmers.
@@ -138,24 +249,50 @@ Provide:
 Keep response under 100 words, conversational tone."""
 
     try:
-        response = bedrock.invoke_model(
+        # Stream the response so Polly synthesis can start on the first
+        # complete sentence instead of waiting for the full reply
+        response = get_bedrock().invoke_model_with_response_stream(
             modelId=BEDROCK_MODEL,
-            body=json.dumps({
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 300,
-                "messages": [{
-                    "role": "user",
-                    "content": prompt
-                }]
-            })
+            body=_fill_body(_INSIGHT_BODY_TPL, prompt)
         )
-        
-        result = json.loads(response['body'].read())
-        insight = result['content'][0]['text'].strip()
-        return get_response_in_language(insight, language)
+
+        sentences = []
+        audio_parts = []
+        buffer = ''
+        for event in response['body']:
+            chunk = json.loads(event['chunk']['bytes'])
+            delta = chunk.get('delta', {}).get('text', '')
+            if not delta:
+                continue
+            buffer += delta
+
+            # Flush on sentence boundary (or overly long clause)
+            cut = max(buffer.rfind('. '), buffer.rfind('? '), buffer.rfind('! '))
+            if cut == -1 and len(buffer) < 80:
+                continue
+            if cut == -1:
+                cut = len(buffer) - 1
+            sentence = buffer[:cut + 1].strip()
+            buffer = buffer[cut + 1:]
+            if sentence:
+                part = synthesize_sentence(sentence, language)
+                if part:
+                    audio_parts.append(part)
+                sentences.append(sentence)
+
+        if buffer.strip():
+            part = synthesize_sentence(buffer.strip(), language)
+            if part:
+                audio_parts.append(part)
+            sentences.append(buffer.strip())
+
+        insight = ' '.join(sentences)
+        return get_response_in_language(insight, language), audio_parts
     except Exception as e:
+        # Discard any partial audio: it belongs to the aborted insight,
+        # not to the canned error text we are about to return
         print(f"Error generating insight: {e}")
-        return "Unable to generate insights at this time."
+        return "Unable to generate insights at this time.", None
 
 def handle_general_query(user_input, language):
     """
@@ -166,13 +303,23 @@ def handle_general_query(user_input, language):
         language
     )
 
+# Process-level price cache: repeat lookups on a warm container skip the
+# DynamoDB round-trip. 15-minute TTL, well inside the 24h DynamoDB TTL.
+_PRICE_CACHE = {}
+_PRICE_CACHE_TTL = 900
+_PRICE_CACHE_MAX = 64
+
 def get_crop_prices(crop):
     """
-    Get crop prices from DynamoDB cache or Agmarknet API
+    Get crop prices from the in-memory cache, DynamoDB cache, or Agmarknet API
     """
-    # Check cache first
+    cached = _PRICE_CACHE.get(crop.upper())
+    if cached and cached[0] > time.time():
+        return cached[1]
+
+    # Check DynamoDB cache next
     try:
-        response = table.get_item(
+        response = get_table().get_item(
             Key={
                 'pk': f'PRICE#{crop.upper()}',
                 'sk': datetime.now().strftime('%Y-%m-%d')
@@ -180,30 +327,64 @@ def get_crop_prices(crop):
         )
         
         if 'Item' in response:
-            return response['Item'].get('prices', [])
+            prices = response['Item'].get('prices', [])
+            _cache_prices(crop, prices)
+            return prices
     except Exception as e:
         print(f"Error reading from cache: {e}")
-    
+
     # Fetch from API (implement Agmarknet integration)
     # For now, return mock data
-    return [
+    prices = [
         {'mandi': 'Delhi', 'price': 2500, 'date': '2026-02-28'},
         {'mandi': 'Mumbai', 'price': 2450, 'date': '2026-02-28'},
         {'mandi': 'Bangalore', 'price': 2600, 'date': '2026-02-28'}
     ]
+    _cache_prices(crop, prices)
+    return prices
+
+def _cache_prices(crop, prices):
+    """
+    Store prices in the process-level cache with bounded size
+    """
+    if len(_PRICE_CACHE) >= _PRICE_CACHE_MAX:
+        oldest = min(_PRICE_CACHE, key=lambda k: _PRICE_CACHE[k][0])
+        del _PRICE_CACHE[oldest]
+    _PRICE_CACHE[crop.upper()] = (time.time() + _PRICE_CACHE_TTL, prices)
+
+CROPS = ['wheat', 'rice', 'tomato', 'potato', 'onion', 'cotton', 'sugarcane']
+
+# Aho-Corasick automaton: one DFA pass over the text instead of one
+# substring scan per crop, so lookup stays O(len(text)) as the vocabulary
+# grows (varieties, Hindi/Kannada names). Falls back to the linear scan
+# if pyahocorasick isn't in the layer.
+try:
+    import ahocorasick
+    _CROP_AUTOMATON = ahocorasick.Automaton()
+    for _crop in CROPS:
+        _CROP_AUTOMATON.add_word(_crop, _crop)
+    _CROP_AUTOMATON.make_automaton()
+except ImportError:
+    _CROP_AUTOMATON = None
 
 def extract_crop_name(text):
     """
     Extract crop name from user input
-    Simple keyword matching for V1
+    Single automaton pass, longest match wins
     """
-    crops = ['wheat', 'rice', 'tomato', 'potato', 'onion', 'cotton', 'sugarcane']
     text_lower = text.lower()
-    
-    for crop in crops:
+
+    if _CROP_AUTOMATON is not None:
+        best = None
+        for _, crop in _CROP_AUTOMATON.iter(text_lower):
+            if best is None or len(crop) > len(best):
+                best = crop
+        return best or 'wheat'
+
+    for crop in CROPS:
         if crop in text_lower:
             return crop
-    
+
     return 'wheat'  # default
 
 def format_price_response(prices, language):
@@ -228,28 +409,112 @@ def get_response_in_language(text, language):
     # For now, return English
     return text
 
-def text_to_speech(text, language):
+def synthesize_sentence(text, language):
     """
-    Convert text to speech using AWS Polly
+    Synthesize a single sentence with Polly while generation continues
+    MP3 frames are self-contained, so parts concatenate cleanly.
+    Returns the MP3 bytes, or None if synthesis failed.
     """
     try:
-        # Map language codes to Polly voice IDs
-        voice_map = {
-            'en-IN': 'Aditi',
-            'hi-IN': 'Aditi',
-            'kn-IN': 'Aditi'  # Polly supports limited Indian languages
-        }
-        
-        response = polly.synthesize_speech(
+        response = get_polly().synthesize_speech(
             Text=text,
             OutputFormat='mp3',
-            VoiceId=voice_map.get(language, 'Aditi'),
+            VoiceId=_VOICE_MAP.get(language, 'Aditi'),
             Engine='neural'
         )
-        
-        # In production, save to S3 and return URL
-        # For now, return placeholder
-        return "https://placeholder-audio-url.mp3"
+        return response['AudioStream'].read()
+    except Exception as e:
+        print(f"Error synthesizing sentence: {e}")
+        return None
+
+# Language -> Polly voice. Immutable reference data, built once.
+# (Polly supports limited Indian languages, so everything maps to Aditi.)
+_VOICE_MAP = MappingProxyType({
+    'en-IN': 'Aditi',
+    'hi-IN': 'Aditi',
+    'kn-IN': 'Aditi'
+})
+
+# Canned phrases ("Sorry, I couldn't find...", the price template) are
+# replayed on thousands of calls - key the audio by content hash so a
+# repeat costs an S3 presign instead of a Polly synthesis. The URL cache
+# skips even the HEAD on a warm container.
+_TTS_URL_CACHE = {}
+_TTS_URL_TTL = 3000  # re-presign well before the 3600s URL expiry
+
+def text_to_speech(text, language, audio_parts=None):
+    """
+    Convert text to speech using AWS Polly
+    Audio is cached in S3 keyed by content hash, so repeated phrases
+    skip synthesis entirely. audio_parts carries MP3 parts already
+    synthesized for exactly this text (the streaming insight path);
+    callers must never pass parts that belong to different text, or the
+    content-addressed cache would serve the wrong audio.
+    """
+    try:
+        voice = _VOICE_MAP.get(language, 'Aditi')
+
+        if not AUDIO_BUCKET:
+            # Local dev without a bucket - just exercise Polly
+            if not audio_parts:
+                get_polly().synthesize_speech(
+                    Text=text,
+                    OutputFormat='mp3',
+                    VoiceId=voice,
+                    Engine='neural'
+                )
+            return "https://placeholder-audio-url.mp3"
+
+        digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        key = f'tts/{language}/{voice}/{digest}.mp3'
+
+        cached = _TTS_URL_CACHE.get(key)
+        if cached and cached[0] > time.time():
+            return cached[1]
+
+        if audio_parts:
+            # Streaming path already produced the audio sentence-by-sentence
+            audio = b''.join(audio_parts)
+        else:
+            try:
+                get_s3().head_object(Bucket=AUDIO_BUCKET, Key=key)
+                return _cache_audio_url(key)
+            except Exception:
+                pass  # not synthesized yet
+
+            response = get_polly().synthesize_speech(
+                Text=text,
+                OutputFormat='mp3',
+                VoiceId=voice,
+                Engine='neural'
+            )
+            audio = response['AudioStream'].read()
+
+        get_s3().put_object(
+            Bucket=AUDIO_BUCKET,
+            Key=key,
+            Body=audio,
+            ContentType='audio/mpeg'
+        )
+        return _cache_audio_url(key)
     except Exception as e:
         print(f"Error in TTS: {e}")
         return None
+
+def _cache_audio_url(key):
+    """
+    Presign an audio object and remember the URL for warm reuse
+    """
+    url = _presign_audio(key)
+    _TTS_URL_CACHE[key] = (time.time() + _TTS_URL_TTL, url)
+    return url
+
+def _presign_audio(key):
+    """
+    Pre-signed GET URL for a synthesized audio object
+    """
+    return get_s3().generate_presigned_url(
+        'get_object',
+        Params={'Bucket': AUDIO_BUCKET, 'Key': key},
+        ExpiresIn=3600
+    )
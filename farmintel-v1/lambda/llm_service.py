@@ -9,10 +9,21 @@ import os
 import boto3
 import urllib3
 import yaml
+from botocore.config import Config
+
+# Shared client config: keep idle sockets warm between invocations,
+# fail fast on dead connections instead of stalling the caller
+_BOTO_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=10,
+    retries={'max_attempts': 2, 'mode': 'adaptive'},
+    max_pool_connections=50,
+    tcp_keepalive=True
+)
 
 # AWS clients
-bedrock = boto3.client("bedrock-runtime", region_name="us-east-1")
-ssm = boto3.client("ssm", region_name="ap-south-1")
+bedrock = boto3.client("bedrock-runtime", region_name="us-east-1", config=_BOTO_CONFIG)
+ssm = boto3.client("ssm", region_name="ap-south-1", config=_BOTO_CONFIG)
 
 # Skill definitions
 SKILLS = {
@@ -247,24 +258,41 @@ def call_groq(messages, max_tokens=150):
 # -------------------------------
 # BEDROCK FALLBACK
 # -------------------------------
-def call_bedrock(system_prompt, user_prompt):
-
-    response = bedrock.invoke_model(
+def call_bedrock_stream(system_prompt, user_prompt):
+    """
+    Stream tokens from Bedrock via the Converse API.
+    Yields text deltas as they arrive, so the first token is usable after
+    ~TTFT instead of after the full generation. Converse also normalizes
+    the request shape across model families (Nova/Llama/Claude), which
+    replaces the per-family invoke_model body builders.
+    """
+    response = bedrock.converse_stream(
         modelId=BEDROCK_MODEL,
-        body=json.dumps({
-            "messages": [{
-                "role": "user",
-                "content": [{"text": system_prompt + "\n\n" + user_prompt}]
-            }],
-            "inferenceConfig": {
-                "max_new_tokens": 150,
-                "temperature": 0.7
-            }
-        })
+        system=[
+            {"text": system_prompt},
+            # Static per skill - cache the encoded prefix
+            {"cachePoint": {"type": "default"}}
+        ],
+        messages=[{
+            "role": "user",
+            "content": [{"text": user_prompt}]
+        }],
+        inferenceConfig={
+            "maxTokens": 150,
+            "temperature": 0.7
+        }
     )
 
-    result = json.loads(response["body"].read())
-    return result["output"]["message"]["content"][0]["text"]
+    for event in response["stream"]:
+        if "contentBlockDelta" in event:
+            yield event["contentBlockDelta"]["delta"]["text"]
+
+
+def call_bedrock(system_prompt, user_prompt):
+
+    # Non-streaming callers (API Gateway buffers the response anyway)
+    # just join the streamed deltas
+    return "".join(call_bedrock_stream(system_prompt, user_prompt))
 
 
 # -------------------------------
@@ -4,15 +4,94 @@ Uses DynamoDB for caching (24-hour TTL)
 """
 import json
 import os
+import threading
+import time
 import boto3
 import requests
+from botocore.config import Config
+from concurrent.futures import Future
 from datetime import datetime, timedelta
-from decimal import Decimal
 
-# Initialize DynamoDB with explicit region
-dynamodb = boto3.resource('dynamodb', region_name='ap-south-1')
+# Shared client config: keep idle sockets warm between invocations,
+# fail fast on dead connections instead of stalling the caller
+_BOTO_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=10,
+    retries={'max_attempts': 2, 'mode': 'adaptive'},
+    max_pool_connections=50,
+    tcp_keepalive=True
+)
+
+# Low-level DynamoDB client: the Resource API deserializes every number
+# into decimal.Decimal, which costs an object per field on price lists
+# and forces default=str in json.dumps. We (de)serialize the wire format
+# by hand and keep native floats throughout.
 TABLE_NAME = os.environ.get('DYNAMODB_TABLE')
-table = dynamodb.Table(TABLE_NAME)
+
+# DAX is a drop-in read/write-through cache in front of DynamoDB
+# (microsecond hits). Opt-in via env so local dev stays on plain DynamoDB.
+if os.environ.get('USE_DAX') == '1':
+    from amazondax import AmazonDaxClient
+    ddb = AmazonDaxClient(
+        endpoint_url=os.environ['DAX_ENDPOINT'],
+        region_name='ap-south-1'
+    )
+else:
+    ddb = boto3.client('dynamodb', region_name='ap-south-1', config=_BOTO_CONFIG)
+
+def _price_to_attr(p):
+    """
+    One price dict -> DynamoDB map attribute
+    """
+    return {'M': {
+        'mandi': {'S': p['mandi']},
+        'state': {'S': p['state']},
+        'district': {'S': p['district']},
+        'price': {'N': str(p['price'])},
+        'min_price': {'N': str(p['min_price'])},
+        'max_price': {'N': str(p['max_price'])},
+        'date': {'S': p['date']},
+        'variety': {'S': p['variety']}
+    }}
+
+def _attr_to_price(attr):
+    """
+    DynamoDB map attribute -> price dict with native floats
+    """
+    m = attr['M']
+    return {
+        'mandi': m['mandi']['S'],
+        'state': m['state']['S'],
+        'district': m['district']['S'],
+        'price': float(m['price']['N']),
+        'min_price': float(m['min_price']['N']),
+        'max_price': float(m['max_price']['N']),
+        'date': m['date']['S'],
+        'variety': m['variety']['S']
+    }
+
+# Reuse one HTTPS session for Agmarknet so keep-alive survives warm invocations
+_http_session = requests.Session()
+
+# Process-level price cache: survives across warm invocations, so repeat
+# lookups for the same crop skip the DynamoDB round-trip entirely.
+# 15-minute TTL keeps it safely fresher than the 24h DynamoDB TTL.
+_PRICE_CACHE = {}
+_PRICE_CACHE_TTL = 900
+_PRICE_CACHE_MAX = 64
+
+def _local_cache_get(crop):
+    entry = _PRICE_CACHE.get(crop.upper())
+    if entry and entry[0] > time.time():
+        return entry[1]
+    return None
+
+def _local_cache_put(crop, prices):
+    if len(_PRICE_CACHE) >= _PRICE_CACHE_MAX:
+        # Drop the stalest entry to stay bounded
+        oldest = min(_PRICE_CACHE, key=lambda k: _PRICE_CACHE[k][0])
+        del _PRICE_CACHE[oldest]
+    _PRICE_CACHE[crop.upper()] = (time.time() + _PRICE_CACHE_TTL, prices)
 
 # Agmarknet API (FREE Government API)
 AGMARKNET_API = "https://api.data.gov.in/resource/9ef84268-d588-465a-a308-a864a43d0070"
@@ -42,7 +121,10 @@ def lambda_handler(event, context):
     elif '/insights/' in path:
         crop = event['pathParameters']['crop']
         return get_insights(crop)
-    
+    elif '/brief/' in path:
+        crop = event['pathParameters']['crop']
+        return get_brief(crop)
+
     return {
         'statusCode': 400,
         'headers': {
@@ -51,237 +133,288 @@ def lambda_handler(event, context):
         'body': json.dumps({'error': 'Invalid endpoint'})
     }
 
-def get_prices(crop):
+def _get_brief_data(crop):
     """
-    Get current prices for a crop
+    One prices fetch + insights calculation shared by all endpoints
     """
-    # Check cache first
-    cached_prices = get_from_cache(crop)
-    if cached_prices:
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Allow-Methods': 'GET,OPTIONS'
-            },
-            'body': json.dumps({
-                'crop': crop,
-                'prices': cached_prices,
-                'count': len(cached_prices),
-                'cached': True
-            }, default=str)
-        }
-    
-    # Fetch from Agmarknet API
-    prices = fetch_from_agmarknet(crop)
-    
-    if prices:
-        # Cache for 24 hours
-        save_to_cache(crop, prices)
-        
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Allow-Methods': 'GET,OPTIONS'
-            },
-            'body': json.dumps({
-                'crop': crop,
-                'prices': prices,
-                'count': len(prices),
-                'cached': False
-            }, default=str)
-        }
-    
+    cached = True
+    prices = get_from_cache(crop)
+
+    if not prices:
+        cached = False
+        prices = fetch_from_agmarknet(crop)
+        if prices:
+            # Cache for 24 hours
+            save_to_cache(crop, prices)
+
+    if not prices:
+        return None
+
     return {
-        'statusCode': 404,
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type',
-            'Access-Control-Allow-Methods': 'GET,OPTIONS'
-        },
-        'body': json.dumps({'error': 'No price data found'})
+        'crop': crop,
+        'prices': prices,
+        'count': len(prices),
+        'cached': cached,
+        'insights': calculate_insights(prices)
     }
 
-def get_insights(crop):
+def _json_response(status, payload):
     """
-    Get selling insights for a crop
+    API Gateway response with CORS headers
     """
-    prices = get_from_cache(crop) or fetch_from_agmarknet(crop)
-    
-    if not prices:
-        return {
-            'statusCode': 404,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Allow-Methods': 'GET,OPTIONS'
-            },
-            'body': json.dumps({'error': 'No price data available'})
-        }
-    
-    # Calculate insights
-    insights = calculate_insights(prices)
-    
     return {
-        'statusCode': 200,
+        'statusCode': status,
         'headers': {
             'Access-Control-Allow-Origin': '*',
             'Access-Control-Allow-Headers': 'Content-Type',
             'Access-Control-Allow-Methods': 'GET,OPTIONS'
         },
-        'body': json.dumps({
-            'crop': crop,
-            'insights': insights
-        }, default=str)
+        'body': json.dumps(payload)
     }
 
-def get_from_cache(crop):
+def get_brief(crop):
     """
-    Get prices from DynamoDB cache
+    Combined prices + insights in a single fetch
+    The dashboard calls this instead of /prices then /insights
     """
-    try:
-        today = datetime.now().strftime('%Y-%m-%d')
-        response = table.get_item(
-            Key={
-                'pk': f'PRICE#{crop.upper()}',
-                'sk': today
-            }
-        )
-        
-        if 'Item' in response:
-            item = response['Item']
-            # Check if not expired
-            if item.get('ttl', 0) > datetime.now().timestamp():
-                return item.get('prices', [])
-    except Exception as e:
-        print(f"Cache read error: {e}")
-    
-    return None
-def get_prices_data(crop):
+    brief = _get_brief_data(crop)
+
+    if not brief:
+        return _json_response(404, {'error': 'No price data found'})
+
+    return _json_response(200, brief)
+
+def get_prices(crop):
     """
-    Get current prices for a crop (returns data only, not HTTP response)
-    Used internally by LLM service
+    Get current prices for a crop
     """
-    # Check cache first
-    cached_prices = get_from_cache(crop)
-    if cached_prices:
-        return cached_prices
+    brief = _get_brief_data(crop)
 
-    # Fetch from Agmarknet API
-    prices = fetch_from_agmarknet(crop)
+    if not brief:
+        return _json_response(404, {'error': 'No price data found'})
 
-    if prices:
-        # Cache for 24 hours
-        save_to_cache(crop, prices)
-        return prices
+    return _json_response(200, {
+        'crop': crop,
+        'prices': brief['prices'],
+        'count': brief['count'],
+        'cached': brief['cached']
+    })
 
-    return None
+def get_insights(crop):
+    """
+    Get selling insights for a crop
+    """
+    brief = _get_brief_data(crop)
 
+    if not brief:
+        return _json_response(404, {'error': 'No price data available'})
 
-def get_insights_data(crop):
+    return _json_response(200, {
+        'crop': crop,
+        'insights': brief['insights']
+    })
+
+def get_from_cache(crop):
     """
-    Get selling insights for a crop (returns data only, not HTTP response)
-    Used internally by LLM service
+    Get prices from the in-memory cache, falling back to DynamoDB
     """
-    prices = get_from_cache(crop) or fetch_from_agmarknet(crop)
+    return get_many_from_cache([crop]).get(crop)
 
-    if not prices:
-        return None
+def get_many_from_cache(crops):
+    """
+    Get cached prices for several crops in one DynamoDB round-trip
+    Returns {crop: prices} with misses/expired entries absent
+    """
+    results = {}
+    key_to_crop = {}
 
-    # Calculate insights
-    insights = calculate_insights(prices)
-    return insights
+    for crop in crops:
+        local = _local_cache_get(crop)
+        if local:
+            results[crop] = local
+        else:
+            key_to_crop[f'PRICE#{crop.upper()}'] = crop
 
+    if not key_to_crop:
+        return results
 
+    try:
+        today = datetime.now().strftime('%Y-%m-%d')
+        now = datetime.now().timestamp()
+        request = {
+            TABLE_NAME: {
+                'Keys': [
+                    {'pk': {'S': pk}, 'sk': {'S': today}}
+                    for pk in key_to_crop
+                ]
+            }
+        }
+
+        # Retry UnprocessedKeys with backoff (throttling under bursts)
+        for attempt in range(3):
+            response = ddb.batch_get_item(RequestItems=request)
+
+            for item in response.get('Responses', {}).get(TABLE_NAME, []):
+                if float(item.get('ttl', {}).get('N', 0)) > now:
+                    crop = key_to_crop[item['pk']['S']]
+                    prices = [_attr_to_price(a) for a in item.get('prices', {}).get('L', [])]
+                    _local_cache_put(crop, prices)
+                    results[crop] = prices
+
+            request = response.get('UnprocessedKeys', {})
+            if not request:
+                break
+            time.sleep(0.05 * (2 ** attempt))
+    except Exception as e:
+        print(f"Cache read error: {e}")
+
+    return results
 
 def save_to_cache(crop, prices):
     """
     Save prices to DynamoDB with 24-hour TTL
     """
+    _local_cache_put(crop, prices)
+
     try:
         today = datetime.now().strftime('%Y-%m-%d')
         ttl = int((datetime.now() + timedelta(hours=24)).timestamp())
-        
-        # Convert prices to use Decimal for DynamoDB
-        prices_decimal = []
-        for p in prices:
-            prices_decimal.append({
-                'mandi': p['mandi'],
-                'state': p['state'],
-                'district': p['district'],
-                'price': Decimal(str(p['price'])),
-                'min_price': Decimal(str(p['min_price'])),
-                'max_price': Decimal(str(p['max_price'])),
-                'date': p['date'],
-                'variety': p['variety']
-            })
-        
-        table.put_item(
+
+        ddb.put_item(
+            TableName=TABLE_NAME,
             Item={
-                'pk': f'PRICE#{crop.upper()}',
-                'sk': today,
-                'prices': prices_decimal,
-                'ttl': ttl,
-                'updated_at': datetime.now().isoformat()
+                'pk': {'S': f'PRICE#{crop.upper()}'},
+                'sk': {'S': today},
+                'prices': {'L': [_price_to_attr(p) for p in prices]},
+                'ttl': {'N': str(ttl)},
+                'updated_at': {'S': datetime.now().isoformat()}
             }
         )
     except Exception as e:
         print(f"Cache write error: {e}")
 
+def _agmarknet_params(crop):
+    """
+    Build Agmarknet query params for a crop
+    """
+    # Map common crop names to Agmarknet commodity names
+    crop_map = {
+        'wheat': 'Wheat',
+        'rice': 'Rice',
+        'tomato': 'Tomato',
+        'potato': 'Potato',
+        'onion': 'Onion',
+        'cotton': 'Cotton',
+        'sugarcane': 'Sugarcane'
+    }
+
+    commodity = crop_map.get(crop.lower(), crop.capitalize())
+
+    return {
+        'api-key': API_KEY,
+        'format': 'json',
+        'filters[commodity]': commodity,
+        'limit': 10
+    }
+
+def _parse_agmarknet_records(records):
+    """
+    Parse raw Agmarknet records into our price dicts
+    """
+    prices = []
+    for record in records:
+        prices.append({
+            'mandi': record.get('market', 'Unknown'),
+            'state': record.get('state', 'Unknown'),
+            'district': record.get('district', 'Unknown'),
+            'price': float(record.get('modal_price', 0)),
+            'min_price': float(record.get('min_price', 0)),
+            'max_price': float(record.get('max_price', 0)),
+            'date': record.get('arrival_date', datetime.now().strftime('%Y-%m-%d')),
+            'variety': record.get('variety', 'General')
+        })
+    return prices
+
+# Single-flight: when a burst of callers misses the cache for the same
+# crop at once, only the first actually hits Agmarknet - the rest wait
+# on its Future instead of issuing duplicate upstream requests
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
 def fetch_from_agmarknet(crop):
     """
     Fetch prices from Agmarknet API (FREE)
+    Concurrent identical requests are coalesced into one upstream call
     """
+    key = crop.lower()
+
+    with _INFLIGHT_LOCK:
+        existing = _INFLIGHT.get(key)
+        if existing is None:
+            future = Future()
+            _INFLIGHT[key] = future
+
+    if existing is not None:
+        return existing.result(timeout=15)
+
     try:
-        # Map common crop names to Agmarknet commodity names
-        crop_map = {
-            'wheat': 'Wheat',
-            'rice': 'Rice',
-            'tomato': 'Tomato',
-            'potato': 'Potato',
-            'onion': 'Onion',
-            'cotton': 'Cotton',
-            'sugarcane': 'Sugarcane'
-        }
-        
-        commodity = crop_map.get(crop.lower(), crop.capitalize())
-        
-        params = {
-            'api-key': API_KEY,
-            'format': 'json',
-            'filters[commodity]': commodity,
-            'limit': 10
-        }
-        
-        response = requests.get(AGMARKNET_API, params=params, timeout=10)
+        prices = _fetch_from_agmarknet(crop)
+        # Populate the local cache before resolving so the waiters'
+        # next lookups never miss
+        _local_cache_put(crop, prices)
+        future.set_result(prices)
+        return prices
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+def _fetch_from_agmarknet(crop):
+    """
+    The actual Agmarknet request (mock data on failure)
+    """
+    try:
+        response = _http_session.get(AGMARKNET_API, params=_agmarknet_params(crop), timeout=10)
         response.raise_for_status()
-        
+
         data = response.json()
-        records = data.get('records', [])
-        
-        # Parse and format prices
-        prices = []
-        for record in records:
-            prices.append({
-                'mandi': record.get('market', 'Unknown'),
-                'state': record.get('state', 'Unknown'),
-                'district': record.get('district', 'Unknown'),
-                'price': float(record.get('modal_price', 0)),
-                'min_price': float(record.get('min_price', 0)),
-                'max_price': float(record.get('max_price', 0)),
-                'date': record.get('arrival_date', datetime.now().strftime('%Y-%m-%d')),
-                'variety': record.get('variety', 'General')
-            })
-        
-        return prices
+        return _parse_agmarknet_records(data.get('records', []))
     except Exception as e:
         print(f"Agmarknet API error: {e}")
         # Return mock data for development
         return get_mock_prices(crop)
 
+async def _fetch_one_async(client, crop):
+    """
+    Fetch a single crop over the shared async client
+    """
+    try:
+        response = await client.get(AGMARKNET_API, params=_agmarknet_params(crop))
+        response.raise_for_status()
+        return _parse_agmarknet_records(response.json().get('records', []))
+    except Exception as e:
+        print(f"Agmarknet API error for {crop}: {e}")
+        return get_mock_prices(crop)
+
+def fetch_many_from_agmarknet(crops):
+    """
+    Fetch prices for several crops in parallel (multi-crop insights)
+    N serial ~300ms requests collapse into roughly one round-trip
+    """
+    import asyncio
+    import httpx
+
+    async def _gather():
+        async with httpx.AsyncClient(timeout=10) as client:
+            results = await asyncio.gather(
+                *[_fetch_one_async(client, crop) for crop in crops]
+            )
+        return dict(zip(crops, results))
+
+    return asyncio.run(_gather())
+
 def get_mock_prices(crop):
     """
     Mock price data for development/testing
@@ -330,16 +463,28 @@ def calculate_insights(prices):
             'confidence': 0
         }
     
-    # Convert Decimal to float for calculations
-    price_values = [float(p['price']) for p in prices]
-    
-    # Calculate average price
-    avg_price = sum(price_values) / len(price_values)
-    
+    # Single pass over the price column: sum, max, min and argmax together
+    # instead of four separate O(N) scans (matters once the Agmarknet
+    # limit is raised beyond a handful of records)
+    price_values = []
+    total = 0.0
+    max_price = min_price = float(prices[0]['price'])
+    best_idx = 0
+    for i, p in enumerate(prices):
+        value = float(p['price'])
+        price_values.append(value)
+        total += value
+        if value > max_price:
+            max_price = value
+            best_idx = i
+        elif value < min_price:
+            min_price = value
+
+    avg_price = total / len(price_values)
+
     # Calculate price volatility
-    price_range = max(price_values) - min(price_values)
-    volatility = (price_range / avg_price) * 100 if avg_price > 0 else 0
-    
+    volatility = ((max_price - min_price) / avg_price) * 100 if avg_price > 0 else 0
+
     # Simple trend analysis
     recent_prices = price_values[:3]
     if len(recent_prices) >= 2:
@@ -362,8 +507,8 @@ def calculate_insights(prices):
         'avg_price': round(avg_price, 2),
         'volatility': round(volatility, 2),
         'confidence': 75,
-        'best_mandi': max(prices, key=lambda x: float(x['price']))['mandi'],
-        'best_price': float(max(price_values))
+        'best_mandi': prices[best_idx]['mandi'],
+        'best_price': max_price
     }
 
 